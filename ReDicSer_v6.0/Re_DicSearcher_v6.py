@@ -6,7 +6,15 @@ import os
 import sys
 import time
 import re
-import shutil
+import threading
+import contextlib
+import functools
+import bisect
+import collections
+try:
+    import ijson   # 大きな JSON を1件ずつ読むため (無ければ json で一括読み込み)
+except ImportError:
+    ijson = None
 
 # ==========================================
 #  定数・設定
@@ -38,18 +46,77 @@ THEMES = {
     }
 }
 
+ThemeResolved = collections.namedtuple("ThemeResolved", (
+    "bg", "fg", "fg_dim", "input_bg", "input_fg", "accent", "accent_hover",
+    "list_bg", "list_fg", "select_bg", "select_fg", "log_fg_info", "log_fg_err",
+    "btn_bg", "btn_fg", "link_fg", "clear_btn_bg", "clear_btn_fg",
+    "log_bg", "log_fg_warn", "form_clear_bg"))
+_THEME_DEFAULTS = {"btn_bg": "#333333", "link_fg": "blue", "clear_btn_bg": "#440000", "clear_btn_fg": "#FF0000"}
+def _resolve_theme(name, colors):
+    dark = name == "Dark"
+    return ThemeResolved(**{**_THEME_DEFAULTS, **colors,
+                            "log_bg": "#050505" if dark else "#FFFFFF",
+                            "log_fg_warn": "#FFD700" if dark else "#FF8C00",
+                            "form_clear_bg": "#444444" if dark else "#AAAAAA"})
+THEMES_RESOLVED = {name: _resolve_theme(name, colors) for name, colors in THEMES.items()}
+
 PART_OF_SPEECH_LIST = [
     "N(名詞)", "V(動詞)", "Adj(形容詞)", "Adv(副詞)", 
     "Conj(接続詞)", "Prep(前置詞)", "Pro(代名詞)", 
     "Det(限定詞)", "Aux(助動詞)", "Part(助詞)", "Num(数詞)", "Other"
 ]
-
+_POS_TUPLE = tuple(PART_OF_SPEECH_LIST)
+_POS_INDEX = {p.split("(")[0]: p for p in PART_OF_SPEECH_LIST}   # "N" -> "N(名詞)"
+_POS_SHORT = {p: code for code, p in _POS_INDEX.items()}         # "N(名詞)" -> "N"
+
+_LINK_PATTERN = re.compile(r'\[([^\]]*?)\]')   # 詳細文中の [単語] をリンクにする
+_SPLASH_FRAMES = tuple(f"LOADING MODULES {ch}" for ch in "|/-\\" * 6)[:21]   # Classic スプラッシュのアニメーション (80ms 毎)
+_LIST_PAGE = 500
+
+_COLS = ("id", "term", "pronunciation", "pos", "meaning", "example", "sort_order")
+_RETURNING = " RETURNING " + ", ".join(_COLS)
+_SQL_ALL = "SELECT " + ", ".join(_COLS) + " FROM dictionary ORDER BY sort_order ASC"
+# 一覧に要るのは id・term・品詞だけ。意味・例文は詳細を表示するときに1行ずつ読む (_SQL_ONE)
+_SQL_LIST = "SELECT id, term, pos, sort_order FROM dictionary ORDER BY sort_order ASC"
+_SQL_ONE = "SELECT " + ", ".join(_COLS) + " FROM dictionary WHERE id = ?"
+_SQL_FULLTEXT = ("SELECT " + ", ".join("d." + c for c in _COLS) +
+                 " FROM dictionary d JOIN dictionary_fts f ON d.id = f.rowid"
+                 " WHERE dictionary_fts MATCH ? ORDER BY rank")
+# LIKE / lower() は ASCII しか大文字小文字を同一視しないので、Python の str.lower で比べる (py_lower は connect で登録)
+_SQL_FULLTEXT_SCAN = ("SELECT " + ", ".join(_COLS) + " FROM dictionary"
+                      " WHERE instr(py_lower(term), ?1) OR instr(py_lower(pronunciation), ?1)"
+                      " OR instr(py_lower(meaning), ?1) OR instr(py_lower(example), ?1)"
+                      " ORDER BY sort_order ASC")
+
+# PyInstaller の展開先 (無ければカレント) は起動中に変わらないので一度だけ求める
+_BASE = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
-    try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE, relative_path)
+
+def _pos_code(pos):
+    code = _POS_SHORT.get(pos)
+    return code if code is not None else pos.split("(")[0]
+
+def _list_label(item):
+    return f"{item['term']} ({_pos_code(item['pos'])})"
+
+def _py_lower(text):
+    return text.lower() if text else text
+
+def _iter_json_items(f):
+    # f はバイナリで開いたファイル。配列形式・{term: {...}} 形式のどちらも1件ずつ dict で返す
+    if ijson is None:
+        content = json.load(f)
+        if isinstance(content, list): yield from content
+        else: yield from (dict(term=k, **v) for k, v in content.items())
+        return
+    while (ch := f.read(1)) and ch in b" \t\r\n": pass
+    if not ch: return # 空・空白だけのファイルは0件 (EOF の b"" は空白扱いにしない)
+    f.seek(0)
+    if ch == b"[": yield from ijson.items(f, "item")
+    else: yield from (dict(term=k, **v) for k, v in ijson.kvitems(f, ""))
 
 # ==========================================
 #  システム設定管理
@@ -61,25 +128,48 @@ class SystemConfig:
             "theme": "Dark",
             "splash_style": "Classic"
         }
+        self._get = self.config.get
+        self._dirty = False
+        self._after_id = None
+        self._tk_root = None
         self.load()
 
+    def bind_root(self, tk_root):
+        # Tk のイベントループがあれば書き込みを after() でまとめて遅延させる
+        self._tk_root = tk_root
+
     def load(self):
         if os.path.exists(CONFIG_FILE):
             try:
                 with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
                     self.config.update(json.load(f))
-            except: pass
+            except (OSError, json.JSONDecodeError, ValueError): pass
 
     def save(self):
         try:
-            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4)
-        except: pass
-
-    def get(self, key): return self.config.get(key)
+            text = json.dumps(self.config, indent=4)
+            try:
+                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                    if f.read() == text: return   # 内容が同じなら書き込まない
+            except FileNotFoundError: pass
+            tmp = CONFIG_FILE + ".tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp, CONFIG_FILE)
+        except (OSError, ValueError): pass
+
+    def flush(self):
+        if self._after_id is not None:
+            self._tk_root.after_cancel(self._after_id); self._after_id = None
+        if self._dirty:
+            self._dirty = False; self.save()
+
+    def get(self, key): return self._get(key)
     def set(self, key, value):
-        self.config[key] = value
-        self.save()
+        if self._get(key) == value: return
+        self.config[key] = value; self._dirty = True
+        if self._tk_root is None: return self.flush()
+        if self._after_id is None: self._after_id = self._tk_root.after(500, self.flush)
 
 # ==========================================
 #  データベース管理クラス
@@ -88,74 +178,250 @@ class DatabaseManager:
     def __init__(self, db_path):
         self.db_path = db_path
         self.conn = None
+        self._lock = threading.RLock()
+        self._cache = None
+        self._cache_ver = None
+        self._index_src = None
+        # 入力→BackSpace で同じ検索を繰り返すことが多いので直近の結果を覚えておく
+        self._cached_search = functools.lru_cache(maxsize=64)(self._search)
+        self._searchers = {"contains": self._search_contains, "startswith": self._search_prefix,
+                           "endswith": self._search_suffix, "fulltext": self._search_fulltext}
         self.connect()
         self.migrate_db()
 
     def connect(self):
-        self.conn = sqlite3.connect(self.db_path)
+        # isolation_level=None: 暗黙のトランザクションを使わず transaction() で明示的に囲む
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None, cached_statements=256)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.create_function("py_lower", 1, _py_lower, deterministic=True)
+        # 読み込み中心の辞書向けチューニング (20MB のページキャッシュ + 256MB の mmap)
+        for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY",
+                       "cache_size=-20000", "mmap_size=268435456", "foreign_keys=ON"):
+            self.conn.execute(f"PRAGMA {pragma}")
 
     def close(self):
+        self._cached_search.cache_clear()
         if self.conn:
             self.conn.close()
 
+    # 結果の読み出しもロックの内側で済ませる (カーソルを返すと他スレッドの execute と読み出しが混ざる)
+    def execute(self, sql, params=()):
+        with self._lock:
+            self.conn.execute(sql, params)
+
+    def fetchall(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def fetchone(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params).fetchone()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        with self._lock:
+            self.conn.execute("BEGIN")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK"); raise
+            else:
+                self.conn.execute("COMMIT")
+
+    def backup_to(self, path):
+        # WAL モードでは未チェックポイントの変更が -wal 側にあるため、ファイルコピーではなく backup API を使う
+        dest = sqlite3.connect(path)
+        try: self.conn.backup(dest)
+        finally: dest.close()
+
+    def run_script(self, script):
+        # 複数の DDL を executescript で一度に流し、途中で失敗したらまとめて取り消す
+        with self._lock:
+            try:
+                self.conn.executescript("BEGIN;\n" + script + "\nCOMMIT;")
+            except sqlite3.Error:
+                if self.conn.in_transaction: self.conn.execute("ROLLBACK")
+                raise
+
     def migrate_db(self):
-        with self.conn:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS dictionary (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    term TEXT,
-                    pronunciation TEXT,
-                    pos TEXT,
-                    meaning TEXT,
-                    example TEXT,
-                    sort_order INTEGER,
-                    UNIQUE(term, pos)
-                )
-            """)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS db_metadata (
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                )
-            """)
+        self.run_script("""
+            CREATE TABLE IF NOT EXISTS dictionary (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                term TEXT,
+                pronunciation TEXT,
+                pos TEXT,
+                meaning TEXT,
+                example TEXT,
+                sort_order INTEGER,
+                UNIQUE(term, pos)
+            );
+            CREATE TABLE IF NOT EXISTS db_metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            -- 一覧表示 (_SQL_LIST) を索引だけで返せる covering index。先頭が sort_order なので ORDER BY も兼ねる
+            CREATE INDEX IF NOT EXISTS idx_sort_list ON dictionary(sort_order, term, pos);
+        """)
+        self.migrate_fts()
+
+    def migrate_fts(self):
+        # 全文検索用の FTS5 索引 (dictionary を content テーブルとしてトリガーで同期)
+        # trigram は日本語のように空白で区切られない語でも部分一致で引ける
+        existed = self.fetchone("SELECT 1 FROM sqlite_master WHERE type='table' AND name='dictionary_fts'") is not None
+        try:
+            self.run_script("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS dictionary_fts USING fts5(
+                    term, pronunciation, pos UNINDEXED, meaning, example,
+                    content='dictionary', content_rowid='id', tokenize='trigram'
+                );
+                CREATE TRIGGER IF NOT EXISTS dictionary_fts_ai AFTER INSERT ON dictionary BEGIN
+                    INSERT INTO dictionary_fts(rowid, term, pronunciation, pos, meaning, example)
+                    VALUES (new.id, new.term, new.pronunciation, new.pos, new.meaning, new.example);
+                END;
+                CREATE TRIGGER IF NOT EXISTS dictionary_fts_ad AFTER DELETE ON dictionary BEGIN
+                    INSERT INTO dictionary_fts(dictionary_fts, rowid, term, pronunciation, pos, meaning, example)
+                    VALUES ('delete', old.id, old.term, old.pronunciation, old.pos, old.meaning, old.example);
+                END;
+                -- sort_order だけの更新 (並び替え) では索引を触らない
+                CREATE TRIGGER IF NOT EXISTS dictionary_fts_au
+                AFTER UPDATE OF term, pronunciation, pos, meaning, example ON dictionary BEGIN
+                    INSERT INTO dictionary_fts(dictionary_fts, rowid, term, pronunciation, pos, meaning, example)
+                    VALUES ('delete', old.id, old.term, old.pronunciation, old.pos, old.meaning, old.example);
+                    INSERT INTO dictionary_fts(rowid, term, pronunciation, pos, meaning, example)
+                    VALUES (new.id, new.term, new.pronunciation, new.pos, new.meaning, new.example);
+                END;
+            """ + ("" if existed else "INSERT INTO dictionary_fts(dictionary_fts) VALUES('rebuild');"))
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            # FTS5 / trigram 非対応の SQLite では全行の走査で代用する
+            self.has_fts = False
+
+    def data_version(self):
+        # data_version は他の接続によるコミットでしか変化しないため、
+        # 自分の接続の変更数 (total_changes) と組にして判定する
+        with self._lock:
+            return (self.conn.execute("PRAGMA data_version").fetchone()[0], self.conn.total_changes)
 
     def get_all_words(self):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM dictionary ORDER BY sort_order ASC")
-        columns = [col[0] for col in cursor.description]
-        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        ver = self.data_version()
+        if ver == self._cache_ver: return self._cache
+        self._cache = self.fetchall(_SQL_LIST); self._cache_ver = ver
+        return self._cache
+
+    def iter_all_words(self):
+        # 全列を溜め込まずに少しずつ返す (エクスポート用。sqlite3.Row は dict と同様に参照できる)
+        # ロックは fetchmany の間だけ持ち、呼び出し側に yield している間は手放す
+        with self._lock:
+            cursor = self.conn.execute(_SQL_ALL)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(500)
+            if not rows: return
+            yield from rows
+
+    def get_word(self, word_id):
+        return self.fetchone(_SQL_ONE, (word_id,))
+
+    def search_words(self, query, mode):
+        # mode: "contains" / "startswith" / "endswith" / "fulltext"。空の検索語は全件
+        if not query: return self.get_all_words()
+        return self._cached_search(mode, query, self.data_version())
+
+    def _term_index(self):
+        # 小文字化済みの term と、前方一致・後方一致用にそれ (と反転したもの) を整列した索引。全件キャッシュが変わった時だけ作り直す
+        # (単語の検索は3つのモードとも str.lower で比べる)
+        words = self.get_all_words()
+        if self._index_src is not words:
+            lows = [w['term'].lower() for w in words]
+            # 部分一致用: 全 term を UTF-8 のバイト列にして区切り文字でつないだ1本と、各 term の開始位置
+            # (日本語が1語でも混ざると str は1文字2バイト以上の表現になるので、バイト列の方が走査が軽い)
+            encoded = [t.encode("utf-8", "surrogatepass") for t in lows]
+            self._joined = b"\x00".join(encoded); self._starts = starts = []
+            pos = 0
+            for b in encoded: starts.append(pos); pos += len(b) + 1
+            starts.append(pos)
+            self._charset = frozenset("".join(lows))
+            pairs = sorted((t, i) for i, t in enumerate(lows))
+            self._prefix_keys = [k for k, _ in pairs]; self._prefix_rows = [i for _, i in pairs]
+            pairs = sorted((t[::-1], i) for i, t in enumerate(lows))
+            self._suffix_keys = [k for k, _ in pairs]; self._suffix_rows = [i for _, i in pairs]
+            self._index_src = words
+        return words
+
+    def _search(self, mode, query, ver):
+        # ver はキャッシュキー用 (DB が変わればキーが変わり、古い結果は使われない)
+        # モードごとの分岐は検索1回につき辞書引き1回で済ませる
+        return self._searchers[mode](query)
+
+    def _search_contains(self, query):
+        # つないだバイト列を find で一気に走査し、
+        # 見つかった位置から bisect で何語目かを割り出す (UTF-8 なので文字の途中で一致することはない)
+        words = self._term_index(); q = query.lower()
+        # どの語にも出てこない文字を含む検索語は走査するまでもなく0件
+        if "\x00" in q or not self._charset.issuperset(q): return []
+        find = self._joined.find; q = q.encode("utf-8", "surrogatepass"); starts = self._starts; hits = []
+        i = find(q)
+        while i != -1:
+            row = bisect.bisect_right(starts, i) - 1
+            hits.append(words[row])
+            i = find(q, starts[row + 1])   # 同じ語の中の2つ目以降の一致は飛ばす
+        return hits
+
+    def _search_prefix(self, query):
+        # 整列した term から二分探索で範囲を引き、元の並び順 (sort_order) に戻す
+        words = self._term_index()
+        return [words[i] for i in sorted(self._key_range(self._prefix_keys, self._prefix_rows, query.lower()))]
+
+    def _search_suffix(self, query):
+        # 反転した検索語の前方一致として同じように引く
+        words = self._term_index()
+        return [words[i] for i in sorted(self._key_range(self._suffix_keys, self._suffix_rows, query.lower()[::-1]))]
+
+    @staticmethod
+    def _key_range(keys, rows, q):
+        lo = bisect.bisect_left(keys, q)
+        return rows[lo:bisect.bisect_left(keys, q + "\U0010ffff", lo)]
+
+    def _search_fulltext(self, query):
+        if self.has_fts and len(query) >= 3:
+            return self.fetchall(_SQL_FULLTEXT, ('"' + query.replace('"', '""') + '"',))
+        # trigram は3文字未満を索引できないので全行を走査する
+        return self.fetchall(_SQL_FULLTEXT_SCAN, (query.lower(),))
 
     def upsert_word(self, data):
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT id FROM dictionary WHERE term = ? AND pos = ?", (data['term'], data['pos']))
-        exists = cursor.fetchone()
-        if exists:
-            cursor.execute("""
+        # 登録済みなら UPDATE の1文で済ませ、行が無かった時だけ末尾の sort_order で INSERT する
+        # (ON CONFLICT 付きの INSERT は衝突しても AUTOINCREMENT の id を1つ消費するので使わない)
+        # 戻り値は (保存後の行, "created" / "updated")
+        with self.transaction() as conn:
+            row = conn.execute("""
                 UPDATE dictionary SET pronunciation=?, meaning=?, example=? WHERE term=? AND pos=?
-            """, (data['pronunciation'], data['meaning'], data['example'], data['term'], data['pos']))
-            self.conn.commit()
-            return "updated"
-        else:
-            cursor.execute("SELECT MAX(sort_order) FROM dictionary")
-            max_order = cursor.fetchone()[0]
-            new_order = 1 if max_order is None else max_order + 1
-            cursor.execute("""
+            """ + _RETURNING, (data['pronunciation'], data['meaning'], data['example'], data['term'], data['pos'])).fetchone()
+            if row: return row, "updated"
+            return conn.execute("""
                 INSERT INTO dictionary (term, pronunciation, pos, meaning, example, sort_order)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (data['term'], data['pronunciation'], data['pos'], data['meaning'], data['example'], new_order))
-            self.conn.commit()
-            return "created"
+                VALUES (?, ?, ?, ?, ?, COALESCE((SELECT MAX(sort_order) + 1 FROM dictionary), 1))
+            """ + _RETURNING, (data['term'], data['pronunciation'], data['pos'], data['meaning'], data['example'])).fetchone(), "created"
+
+    def bulk_upsert(self, rows):
+        # rows: (term, pronunciation, pos, meaning, example) の iterable。インポート全体を1トランザクション (コミット1回) で書く
+        # executemany では1行ごとに MAX(sort_order) が再評価されるので新規行は順に末尾へ並ぶ
+        sql = """
+            INSERT INTO dictionary (term, pronunciation, pos, meaning, example, sort_order)
+            VALUES (?, ?, ?, ?, ?, COALESCE((SELECT MAX(sort_order) + 1 FROM dictionary), 1))
+            ON CONFLICT(term, pos) DO UPDATE SET
+                pronunciation=excluded.pronunciation, meaning=excluded.meaning, example=excluded.example
+        """
+        with self.transaction() as conn:
+            conn.executemany(sql, rows)
 
     def delete_word(self, term, pos):
-        self.conn.execute("DELETE FROM dictionary WHERE term = ? AND pos = ?", (term, pos))
-        self.conn.commit()
+        self.execute("DELETE FROM dictionary WHERE term = ? AND pos = ?", (term, pos))
 
     def update_order(self, id1, order1, id2, order2):
-        cursor = self.conn.cursor()
-        cursor.execute("UPDATE dictionary SET sort_order = ? WHERE id = ?", (order1, id1))
-        cursor.execute("UPDATE dictionary SET sort_order = ? WHERE id = ?", (order2, id2))
-        self.conn.commit()
+        # 2行の入れ替えは CASE で1文にまとめ、更新後の2行を返す
+        with self.transaction() as conn:
+            return conn.execute("UPDATE dictionary SET sort_order = CASE id WHEN ? THEN ? WHEN ? THEN ? END WHERE id IN (?, ?)" + _RETURNING,
+                                (id1, order1, id2, order2, id1, id2)).fetchall()
 
 # ==========================================
 #  メインアプリケーション
@@ -167,6 +433,8 @@ class ReDicSearcherApp:
         self.root.withdraw() 
 
         self.sys_config = SystemConfig()
+        self.sys_config.bind_root(self.root)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         last_db = self.sys_config.get("last_db_path")
         if not os.path.exists(last_db) and last_db != DEFAULT_DB_NAME:
             last_db = DEFAULT_DB_NAME
@@ -175,11 +443,15 @@ class ReDicSearcherApp:
         
         self.current_theme_name = self.sys_config.get("theme")
         self.splash_style = self.sys_config.get("splash_style")
-        self.colors = THEMES[self.current_theme_name]
+        self.colors = THEMES[self.current_theme_name]; self.theme = THEMES_RESOLVED[self.current_theme_name]
         
         self.search_mode = tk.StringVar(value="contains")
         self.data_cache = []
-        self.widgets = {}
+        self._all_words_dirty = True
+        self._search_after_id = None
+        self._shown_keys = []; self._shown_src = None
+        self._list_labels = {}
+        self._frames = []; self._labels = []; self._entries = []
         self.display_items = []
         
         self.apply_theme_to_root()
@@ -198,17 +470,23 @@ class ReDicSearcherApp:
         self.root.bind('<Control-n>', lambda e: self.clear_form())
         self.root.bind('<Escape>', lambda e: self.clear_search())
 
+    def on_close(self):
+        self.sys_config.flush()
+        self.db_manager.close()
+        self.root.destroy()
+
     def focus_search(self):
         if self.current_mode == "read":
             self.entry_search.focus_set(); self.entry_search.select_range(0, tk.END)
 
     def show_splash(self):
-        splash = tk.Toplevel(self.root)
+        splash = tk.Toplevel(self.root); c = self.colors
+        self._start_bg_load()
         splash.overrideredirect(True); splash.attributes('-topmost', True)
         w, h = 500, 300
         x = (self.root.winfo_screenwidth()//2) - (w//2)
         y = (self.root.winfo_screenheight()//2) - (h//2)
-        splash.geometry(f"{w}x{h}+{x}+{y}"); splash.configure(bg=self.colors["bg"])
+        splash.geometry(f"{w}x{h}+{x}+{y}"); splash.configure(bg=c["bg"])
         
         if self.splash_style == "Modern":
             # Modern Style
@@ -218,70 +496,73 @@ class ReDicSearcherApp:
                 if os.path.exists(img_path):
                     raw = Image.open(img_path); raw.thumbnail((100, 100))
                     img = ImageTk.PhotoImage(raw)
-                    lbl = tk.Label(splash, image=img, bg=self.colors["bg"])
+                    lbl = tk.Label(splash, image=img, bg=c["bg"])
                     lbl.image = img; lbl.pack(pady=20)
             except: pass
-            tk.Label(splash, text=f"Re.Dic {APP_VERSION}", font=("Consolas", 30, "bold"), bg=self.colors["bg"], fg=self.colors["fg"]).pack(pady=10)
-            tk.Label(splash, text=f"Loading: {os.path.basename(self.db_manager.db_path)}", font=("Consolas", 10), bg=self.colors["bg"], fg=self.colors["fg"]).pack(side=tk.BOTTOM, pady=20)
+            tk.Label(splash, text=f"Re.Dic {APP_VERSION}", font=("Consolas", 30, "bold"), bg=c["bg"], fg=c["fg"]).pack(pady=10)
+            tk.Label(splash, text=f"Loading: {os.path.basename(self.db_manager.db_path)}", font=("Consolas", 10), bg=c["bg"], fg=c["fg"]).pack(side=tk.BOTTOM, pady=20)
             splash.after(1500, lambda: self.startup_sequence(splash))
         else:
             # Classic Style (Animation restored)
-            tk.Frame(splash, bg=self.colors["fg"], width=w, height=2).pack(side=tk.TOP)
-            tk.Frame(splash, bg=self.colors["fg"], width=w, height=2).pack(side=tk.BOTTOM)
-            tk.Frame(splash, bg=self.colors["fg"], width=2, height=h).place(x=0, y=0)
-            tk.Frame(splash, bg=self.colors["fg"], width=2, height=h).place(x=w-2, y=0)
+            tk.Frame(splash, bg=c["fg"], width=w, height=2).pack(side=tk.TOP)
+            tk.Frame(splash, bg=c["fg"], width=w, height=2).pack(side=tk.BOTTOM)
+            tk.Frame(splash, bg=c["fg"], width=2, height=h).place(x=0, y=0)
+            tk.Frame(splash, bg=c["fg"], width=2, height=h).place(x=w-2, y=0)
             
-            content = tk.Frame(splash, bg=self.colors["bg"])
+            content = tk.Frame(splash, bg=c["bg"])
             content.pack(expand=True)
-            tk.Label(content, text=f"[SYSTEM {APP_VERSION}]", font=("Consolas", 16, "bold"), bg=self.colors["bg"], fg=self.colors["fg"]).pack(pady=10)
-            tk.Label(content, text=f"MOUNTING: {os.path.basename(self.db_manager.db_path)}", font=("Consolas", 10), bg=self.colors["bg"], fg=self.colors["fg"]).pack(pady=5)
+            tk.Label(content, text=f"[SYSTEM {APP_VERSION}]", font=("Consolas", 16, "bold"), bg=c["bg"], fg=c["fg"]).pack(pady=10)
+            tk.Label(content, text=f"MOUNTING: {os.path.basename(self.db_manager.db_path)}", font=("Consolas", 10), bg=c["bg"], fg=c["fg"]).pack(pady=5)
             
-            loading_lbl = tk.Label(content, text="", font=("Consolas", 12), bg=self.colors["bg"], fg=self.colors["fg"])
+            loading_lbl = tk.Label(content, text="", font=("Consolas", 12), bg=c["bg"], fg=c["fg"])
             loading_lbl.pack(pady=10)
             
-            def update_loading(count=0):
-                chars = ["|", "/", "-", "\\"]
-                loading_lbl.config(text=f"LOADING MODULES {chars[count % 4]}")
-                if count < 20: 
-                    splash.after(80, update_loading, count+1)
-                else:
-                    self.startup_sequence(splash)
-            update_loading()
+            # 全コマを最初にまとめて予約し、最後のコマの後で起動処理へ進む
+            for i, text in enumerate(_SPLASH_FRAMES): splash.after(80 * i, loading_lbl.config, {"text": text})
+            splash.after(80 * (len(_SPLASH_FRAMES) - 1), self.startup_sequence, splash)
+
+    def _start_bg_load(self):
+        # スプラッシュを出している間に全件読み込みを裏のスレッドで済ませておく
+        self._bg_words = None
+        self._bg_thread = threading.Thread(target=self._load_words_bg, daemon=True); self._bg_thread.start()
+    def _load_words_bg(self):
+        self._bg_words = self.db_manager.get_all_words()
 
     def startup_sequence(self, splash):
-        self.data_cache = self.db_manager.get_all_words()
+        # Tk はメインスレッドからしか触れないので、読み込みの完了は after で待つ
+        if self._bg_thread.is_alive(): return splash.after(50, self.startup_sequence, splash)
+        if self._bg_words is not None: self._set_all_words(self._bg_words)
+        self._get_all_words_cached()
         self.setup_ui()
         splash.destroy()
         self.root.deiconify()
         self.log(f"System ready {APP_VERSION}. Cartridge loaded: {os.path.basename(self.db_manager.db_path)}", "success")
 
     def setup_ui(self):
-        self.widgets = {}
+        # テーマの塗り分けごとにウィジェットを登録しておく (背景のみ / ラベル / 入力欄)
+        self._frames = []; self._labels = []; self._entries = []
         # Header
         header = tk.Frame(self.root, bg=self.colors["bg"], pady=10, padx=10)
         header.pack(fill=tk.X)
-        self.widgets["header_frame"] = header
+        self._frames.append(header)
 
         self.btn_db = tk.Button(header, text="💾 CARTRIDGE", command=self.open_db_menu, relief="flat", padx=10)
         self.btn_db.pack(side=tk.LEFT, padx=(0, 5))
-        self.widgets["btn_db"] = self.btn_db
 
         self.btn_config = tk.Button(header, text="⚙ CONFIG", command=self.open_config_dialog, relief="flat", padx=10)
         self.btn_config.pack(side=tk.LEFT)
-        self.widgets["btn_config"] = self.btn_config
 
         self.btn_mode = tk.Button(header, text="MODE: READ", command=self.toggle_mode, relief="flat", padx=15, font=("Consolas", 11, "bold"))
         self.btn_mode.pack(side=tk.RIGHT)
-        self.widgets["btn_mode"] = self.btn_mode
 
         # Content
         self.content_frame = tk.Frame(self.root, bg=self.colors["bg"])
         self.content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-        self.widgets["content_frame"] = self.content_frame
+        self._frames.append(self.content_frame)
         self.frame_read = tk.Frame(self.content_frame, bg=self.colors["bg"])
         self.setup_read_mode()
-        self.frame_write = tk.Frame(self.content_frame, bg=self.colors["bg"])
-        self.setup_write_mode()
+        # 編集画面は初めて WRITE に切り替えた時に作る (起動時は READ だけ)
+        self.frame_write = None; self.entry_labels = []
         
         self.current_mode = "read"
         self.frame_read.pack(fill=tk.BOTH, expand=True)
@@ -289,87 +570,91 @@ class ReDicSearcherApp:
         # Log
         log_frame = tk.Frame(self.root, bg=self.colors["bg"], padx=10, pady=10)
         log_frame.pack(fill=tk.X, side=tk.BOTTOM)
-        self.widgets["log_frame"] = log_frame
+        self._frames.append(log_frame)
         self.lbl_log_title = tk.Label(log_frame, text="--- SYSTEM LOG ---", font=("Consolas", 9))
         self.lbl_log_title.pack(anchor="w")
-        self.widgets["lbl_log_title"] = self.lbl_log_title
+        self._labels.append(self.lbl_log_title)
         self.log_text = tk.Text(log_frame, height=4, font=("Consolas", 10), state="disabled", relief="solid", bd=1)
         self.log_text.pack(fill=tk.X)
-        self.widgets["log_text"] = self.log_text
 
         self.apply_theme_to_widgets()
         self.refresh_list()
 
     def setup_read_mode(self):
-        self.widgets["frame_read"] = self.frame_read
+        self._frames.append(self.frame_read)
         search_frame = tk.Frame(self.frame_read, bg=self.colors["bg"], pady=5)
         search_frame.pack(fill=tk.X)
-        self.widgets["search_frame"] = search_frame
+        self._frames.append(search_frame)
         
         lbl_search = tk.Label(search_frame, text="SEARCH >", font=("Consolas", 11, "bold"))
         lbl_search.pack(side=tk.LEFT)
-        self.widgets["lbl_search"] = lbl_search
+        self._labels.append(lbl_search)
         
         self.entry_search = tk.Entry(search_frame, font=("Consolas", 11), relief="flat")
         self.entry_search.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 0), ipady=3)
         self.entry_search.bind('<KeyRelease>', self.on_search)
-        self.widgets["entry_search"] = self.entry_search
+        self._entries.append(self.entry_search)
 
         self.btn_clear_search = tk.Button(search_frame, text="×", command=self.clear_search, relief="flat", width=3, font=("Consolas", 10, "bold"))
         self.btn_clear_search.pack(side=tk.LEFT, padx=(0, 10))
-        self.widgets["btn_clear_search"] = self.btn_clear_search
 
         opt_frame = tk.Frame(search_frame, bg=self.colors["bg"])
         opt_frame.pack(side=tk.LEFT)
-        self.widgets["opt_frame"] = opt_frame
+        self._frames.append(opt_frame)
         self.radios = []
-        for text, mode in [("In", "contains"), ("Start", "startswith"), ("End", "endswith")]:
+        for text, mode in [("In", "contains"), ("Start", "startswith"), ("End", "endswith"), ("Text", "fulltext")]:
             rb = tk.Radiobutton(opt_frame, text=text, variable=self.search_mode, value=mode, command=self.on_search, font=("Consolas", 9), selectcolor=self.colors["bg"])
             rb.pack(side=tk.LEFT); self.radios.append(rb)
 
         paned = tk.PanedWindow(self.frame_read, orient=tk.HORIZONTAL, bg=self.colors["bg"], sashwidth=4)
         paned.pack(fill=tk.BOTH, expand=True, pady=5)
-        self.widgets["paned"] = paned
         left_group = tk.Frame(paned, bg=self.colors["bg"])
         paned.add(left_group, minsize=280)
-        self.widgets["left_group"] = left_group
+        self._frames.append(left_group)
         order_frame = tk.Frame(left_group, bg=self.colors["bg"]); order_frame.pack(side=tk.LEFT, fill=tk.Y)
-        self.widgets["order_frame"] = order_frame
+        self._frames.append(order_frame)
         self.btn_up = tk.Button(order_frame, text="▲", command=self.move_up, relief="flat", width=2); self.btn_up.pack(side=tk.TOP, pady=2)
         self.btn_down = tk.Button(order_frame, text="▼", command=self.move_down, relief="flat", width=2); self.btn_down.pack(side=tk.TOP, pady=2)
-        self.widgets["btn_up"] = self.btn_up; self.widgets["btn_down"] = self.btn_down
         
         self.listbox = tk.Listbox(left_group, font=("Consolas", 11), borderwidth=1, relief="solid")
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.listbox.bind('<<ListboxSelect>>', self.show_detail)
-        self.widgets["listbox"] = self.listbox
-        sb = tk.Scrollbar(left_group, orient=tk.VERTICAL, command=self.listbox.yview); sb.pack(side=tk.RIGHT, fill=tk.Y); self.listbox.config(yscrollcommand=sb.set)
+        sb = tk.Scrollbar(left_group, orient=tk.VERTICAL, command=self.listbox.yview); sb.pack(side=tk.RIGHT, fill=tk.Y); self.listbox.config(yscrollcommand=self._on_list_scroll)
+        self._list_sb = sb
 
         detail_frame = tk.Frame(paned, bg=self.colors["bg"], padx=15); paned.add(detail_frame, minsize=400)
-        self.widgets["detail_frame"] = detail_frame
+        self._frames.append(detail_frame)
         self.lbl_detail_term = tk.Label(detail_frame, text="", font=("Consolas", 20, "bold"), anchor="w"); self.lbl_detail_term.pack(fill=tk.X, pady=(0, 10))
-        self.widgets["lbl_detail_term"] = self.lbl_detail_term
+        self._labels.append(self.lbl_detail_term)
         self.detail_text = tk.Text(detail_frame, font=("Consolas", 11), height=15, state="disabled", relief="flat", wrap="word"); self.detail_text.pack(fill=tk.BOTH, expand=True)
-        self.widgets["detail_text"] = self.detail_text
+        # リンクのハンドラは共通タグ "hyperlink" に一度だけ付け、単語はクリック位置の link_ タグから読む
+        self.detail_text.tag_bind("hyperlink", "<Button-1>", self._on_any_link_click)
+        self.detail_text.tag_bind("hyperlink", "<Enter>", lambda e: self.detail_text.config(cursor="hand2"))
+        self.detail_text.tag_bind("hyperlink", "<Leave>", lambda e: self.detail_text.config(cursor=""))
+
+    def _on_any_link_click(self, event):
+        idx = self.detail_text.index(f"@{event.x},{event.y}")
+        for tag in self.detail_text.tag_names(idx):
+            if tag.startswith("link_"): return self.jump_to_word_filter(tag[5:])
 
     def setup_write_mode(self):
-        self.widgets["frame_write"] = self.frame_write
+        self._frames.append(self.frame_write)
         self.entry_labels = []; self.entries = {}
         lbl_title = tk.Label(self.frame_write, text="EDITOR / REGISTRATION", font=("Consolas", 14, "bold"), anchor="w"); lbl_title.pack(pady=(0, 15))
-        self.widgets["lbl_write_title"] = lbl_title
+        self._labels.append(lbl_title)
         def create_row(label, key):
             lbl = tk.Label(self.frame_write, text=f"■ {label}", font=("Consolas", 10, "bold"), anchor="w"); lbl.pack(anchor="w"); self.entry_labels.append(lbl)
             ent = tk.Entry(self.frame_write, font=("Consolas", 11), relief="flat"); ent.pack(fill=tk.X, pady=(0, 10), ipady=5); self.entries[key] = ent
-            self.widgets[f"entry_{key}"] = ent
+            self._entries.append(ent)
         create_row("単語 (Term)", "term"); create_row("発音 (Pronunciation)", "pronunciation")
         lbl_pos = tk.Label(self.frame_write, text="■ 品詞 (Part of Speech)", font=("Consolas", 10, "bold"), anchor="w"); lbl_pos.pack(anchor="w"); self.entry_labels.append(lbl_pos)
-        self.pos_var = tk.StringVar(value=PART_OF_SPEECH_LIST[0])
-        self.pos_menu = tk.OptionMenu(self.frame_write, self.pos_var, *PART_OF_SPEECH_LIST); self.pos_menu.config(relief="flat", highlightthickness=0, font=("Consolas", 11)); self.pos_menu.pack(fill=tk.X, pady=(0, 10), ipady=3); self.widgets["pos_menu"] = self.pos_menu
+        self.pos_var = tk.StringVar(value=_POS_TUPLE[0])
+        self.pos_menu = tk.OptionMenu(self.frame_write, self.pos_var, *_POS_TUPLE); self.pos_menu.config(relief="flat", highlightthickness=0, font=("Consolas", 11)); self.pos_menu.pack(fill=tk.X, pady=(0, 10), ipady=3)
         create_row("意味 (Meaning)", "meaning"); create_row("使用例 (Example)", "example")
-        btn_box = tk.Frame(self.frame_write, bg=self.colors["bg"], pady=15); btn_box.pack(fill=tk.X); self.widgets["btn_box"] = btn_box
-        self.btn_save = tk.Button(btn_box, text="💾 SAVE (Ctrl+S)", command=self.save_entry, relief="flat", padx=20, font=("Consolas", 10, "bold")); self.btn_save.pack(side=tk.LEFT, padx=5); self.widgets["btn_save"] = self.btn_save
-        self.btn_clear = tk.Button(btn_box, text="CLEAR (Ctrl+N)", command=self.clear_form, relief="flat", padx=10); self.btn_clear.pack(side=tk.LEFT, padx=5); self.widgets["btn_clear"] = self.btn_clear
-        self.btn_delete = tk.Button(btn_box, text="🗑 DELETE", command=self.delete_entry, relief="flat", padx=10); self.btn_delete.pack(side=tk.RIGHT); self.widgets["btn_delete"] = self.btn_delete
+        btn_box = tk.Frame(self.frame_write, bg=self.colors["bg"], pady=15); btn_box.pack(fill=tk.X); self._frames.append(btn_box)
+        self.btn_save = tk.Button(btn_box, text="💾 SAVE (Ctrl+S)", command=self.save_entry, relief="flat", padx=20, font=("Consolas", 10, "bold")); self.btn_save.pack(side=tk.LEFT, padx=5)
+        self.btn_clear = tk.Button(btn_box, text="CLEAR (Ctrl+N)", command=self.clear_form, relief="flat", padx=10); self.btn_clear.pack(side=tk.LEFT, padx=5)
+        self.btn_delete = tk.Button(btn_box, text="🗑 DELETE", command=self.delete_entry, relief="flat", padx=10); self.btn_delete.pack(side=tk.RIGHT)
 
     # ==========================================
     #  ★ 機能ロジック (不足していた部分を全て実装)
@@ -400,7 +685,7 @@ class ReDicSearcherApp:
             path = filedialog.asksaveasfilename(title="Export to JSON", defaultextension=".json", filetypes=[("JSON Files", "*.json")])
             if path:
                 try:
-                    data = self.db_manager.get_all_words()
+                    data = [dict(row) for row in self.db_manager.iter_all_words()]
                     with open(path, 'w', encoding='utf-8') as f: json.dump(data, f, indent=4, ensure_ascii=False)
                     self.log(f"Exported to JSON: {os.path.basename(path)}", "success"); dlg.destroy()
                 except Exception as e: self.log(f"Export Error: {e}", "error")
@@ -409,7 +694,7 @@ class ReDicSearcherApp:
             path = filedialog.asksaveasfilename(title="Export to New DB (Backup)", defaultextension=".db", filetypes=[("DB Files", "*.db")])
             if path:
                 try:
-                    shutil.copy2(self.db_manager.db_path, path)
+                    self.db_manager.backup_to(path)
                     self.log(f"Exported DB Copy: {os.path.basename(path)}", "success"); dlg.destroy()
                 except Exception as e: self.log(f"Export Error: {e}", "error")
         
@@ -424,7 +709,7 @@ class ReDicSearcherApp:
 
     def switch_db(self, new_db_path):
         self.db_manager.close()
-        self.db_manager = DatabaseManager(new_db_path)
+        self.db_manager = DatabaseManager(new_db_path); self._all_words_dirty = True
         self.sys_config.set("last_db_path", new_db_path)
         self.entry_search.delete(0, tk.END)
         self.apply_theme_to_root()
@@ -442,25 +727,25 @@ class ReDicSearcherApp:
         if self.listbox.size() > 0: self.listbox.selection_set(0); self.show_detail(None)
 
     def apply_theme_to_widgets(self):
-        c = self.colors
-        for name, w in self.widgets.items():
-            if "frame" in name or "group" in name or "box" in name: w.configure(bg=c["bg"])
-            if "lbl" in name: w.configure(bg=c["bg"], fg=c["fg"])
-            if "entry" in name: w.configure(bg=c["input_bg"], fg=c["input_fg"], insertbackground=c["fg"])
-        for lbl in self.entry_labels: lbl.configure(bg=c["bg"], fg=c["fg_dim"])
-        btn_bg = c.get("btn_bg", "#333333")
-        for btn in [self.btn_db, self.btn_config, self.btn_up, self.btn_down]: btn.configure(bg=btn_bg, fg=c["fg"])
-        self.btn_clear_search.configure(bg=c.get("clear_btn_bg", "#440000"), fg=c.get("clear_btn_fg", "#FF0000"))
-        self.btn_mode.configure(bg=c["accent"], fg="#FFFFFF")
-        self.btn_save.configure(bg=c["accent"], fg="#FFFFFF")
-        self.btn_clear.configure(bg="#444444" if self.current_theme_name=="Dark" else "#AAAAAA", fg="#FFFFFF")
+        t = self.theme
+        bg = t.bg; fg = t.fg
+        for w in self._frames: w.configure(bg=bg)
+        for w in self._labels: w.configure(bg=bg, fg=fg)
+        for w in self._entries: w.configure(bg=t.input_bg, fg=t.input_fg, insertbackground=fg)
+        for lbl in self.entry_labels: lbl.configure(bg=bg, fg=t.fg_dim)
+        for btn in [self.btn_db, self.btn_config, self.btn_up, self.btn_down]: btn.configure(bg=t.btn_bg, fg=fg)
+        self.btn_clear_search.configure(bg=t.clear_btn_bg, fg=t.clear_btn_fg)
+        self.btn_mode.configure(bg=t.accent, fg="#FFFFFF")
+        self.listbox.configure(bg=t.list_bg, fg=t.list_fg, selectbackground=t.select_bg, selectforeground=t.select_fg)
+        self.detail_text.configure(bg=bg, fg=fg)
+        self.log_text.configure(bg=t.log_bg, fg=fg)
+        for rb in self.radios: rb.configure(bg=bg, fg=fg, selectcolor=bg, activebackground=bg, activeforeground=fg)
+        if self.frame_write is None: return
+        self.btn_save.configure(bg=t.accent, fg="#FFFFFF")
+        self.btn_clear.configure(bg=t.form_clear_bg, fg="#FFFFFF")
         self.btn_delete.configure(bg="#CC0000", fg="#FFFFFF")
-        self.listbox.configure(bg=c["list_bg"], fg=c["list_fg"], selectbackground=c["select_bg"], selectforeground=c["select_fg"])
-        self.detail_text.configure(bg=c["bg"], fg=c["fg"])
-        self.log_text.configure(bg="#050505" if self.current_theme_name=="Dark" else "#FFFFFF", fg=c["fg"])
-        for rb in self.radios: rb.configure(bg=c["bg"], fg=c["fg"], selectcolor=c["bg"], activebackground=c["bg"], activeforeground=c["fg"])
-        self.pos_menu.configure(bg=c["input_bg"], fg=c["fg"], activebackground=c["accent"], activeforeground="#FFFFFF")
-        self.pos_menu["menu"].configure(bg=c["input_bg"], fg=c["fg"])
+        self.pos_menu.configure(bg=t.input_bg, fg=fg, activebackground=t.accent, activeforeground="#FFFFFF")
+        self.pos_menu["menu"].configure(bg=t.input_bg, fg=fg)
 
     def open_config_dialog(self):
         dlg = tk.Toplevel(self.root); dlg.title("Settings"); dlg.geometry("400x300"); c = self.colors; dlg.configure(bg=c["bg"])
@@ -483,7 +768,7 @@ class ReDicSearcherApp:
         def save():
             self.sys_config.set("theme", self.var_theme.get()); self.sys_config.set("splash_style", self.var_splash.get())
             self.current_theme_name = self.var_theme.get(); self.splash_style = self.var_splash.get()
-            self.colors = THEMES[self.current_theme_name]; self.apply_theme_to_root(); self.apply_theme_to_widgets()
+            self.colors = THEMES[self.current_theme_name]; self.theme = THEMES_RESOLVED[self.current_theme_name]; self.apply_theme_to_root(); self.apply_theme_to_widgets()
             self.log("Config Saved.", "success"); dlg.destroy()
         tk.Button(dlg, text="SAVE & CLOSE", command=save, bg=c["accent"], fg="white", font=("Consolas", 10, "bold"), relief="flat", padx=15).pack(pady=20)
         self.apply_temp_theme(self.current_theme_name, dlg, rbs)
@@ -498,11 +783,14 @@ class ReDicSearcherApp:
 
     def toggle_mode(self):
         if self.current_mode == "read":
+            if self.frame_write is None:
+                self.frame_write = tk.Frame(self.content_frame, bg=self.colors["bg"])
+                self.setup_write_mode(); self.apply_theme_to_widgets()
             self.frame_read.pack_forget(); self.frame_write.pack(fill=tk.BOTH, expand=True)
             self.current_mode = "write"; self.btn_mode.config(text="MODE: WRITE (Ctrl+M)")
             try:
                 sel = self.listbox.curselection()
-                if sel and sel[0] < len(self.display_items): self.fill_form(self.display_items[sel[0]])
+                if sel and sel[0] < len(self.display_items): self.fill_form(self.db_manager.get_word(self.display_items[sel[0]]['id']))
             except: pass
         else:
             self.frame_write.pack_forget(); self.frame_read.pack(fill=tk.BOTH, expand=True)
@@ -510,10 +798,10 @@ class ReDicSearcherApp:
 
     def log(self, message, level="info"):
         self.log_text.config(state="normal")
-        c = self.colors
-        self.log_text.tag_config("info", foreground=c["log_fg_info"]); self.log_text.tag_config("error", foreground=c["log_fg_err"])
-        self.log_text.tag_config("success", foreground=c["accent"]); self.log_text.tag_config("warn", foreground="#FFD700" if self.current_theme_name=="Dark" else "#FF8C00")
-        self.log_text.insert(tk.END, f"{time.strftime('[%H:%M:%S]')} ", "info"); self.log_text.insert(tk.END, f"{message}\n", level)
+        t = self.theme
+        self.log_text.tag_config("info", foreground=t.log_fg_info); self.log_text.tag_config("error", foreground=t.log_fg_err)
+        self.log_text.tag_config("success", foreground=t.accent); self.log_text.tag_config("warn", foreground=t.log_fg_warn)
+        self.log_text.insert(tk.END, f"{time.strftime('[%H:%M:%S]')} ", "info", f"{message}\n", level)
         self.log_text.see(tk.END); self.log_text.config(state="disabled")
 
     def import_json_dialog(self):
@@ -522,62 +810,88 @@ class ReDicSearcherApp:
 
     def import_json_logic(self, filepath):
         try:
-            with open(filepath, 'r', encoding='utf-8') as f: content = json.load(f)
-            items = content if isinstance(content, list) else [dict(term=k, **v) for k, v in content.items()]
             count = 0
-            for item in items:
-                term = item.get("term", item.get("word", ""))
-                if term:
-                    self.db_manager.upsert_word({
-                        'term': term, 'pronunciation': item.get("pronunciation", ""),
-                        'pos': item.get("part_of_speech", item.get("pos", "")),
-                        'meaning': item.get("definition", item.get("meaning", "")),
-                        'example': item.get("example", "")
-                    }); count += 1
+            def rows(items):
+                # 読んだそばから executemany に流し、ファイル全体をメモリに載せない
+                # (数万件のインポートでも属性参照が行ごとに走らないようローカルに束ねておく)
+                nonlocal count
+                for item in items:
+                    get = item.get
+                    term = get("term", get("word", ""))
+                    if term:
+                        count += 1
+                        yield (term, get("pronunciation", ""), get("part_of_speech", get("pos", "")),
+                               get("definition", get("meaning", "")), get("example", ""))
+            with open(filepath, 'rb') as f: self.db_manager.bulk_upsert(rows(_iter_json_items(f)))
+            self._all_words_dirty = True
             self.log(f"Imported {count} items.", "success"); self.refresh_list()
         except Exception as e: self.log(f"Import Error: {e}", "error")
 
-    def on_search(self, event=None): self.refresh_list(self.entry_search.get())
+    def on_search(self, event=None):
+        # 連続したキー入力は 150ms 止まってから1回だけ絞り込む
+        if self._search_after_id: self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(150, self._run_search)
+    def _run_search(self):
+        self._search_after_id = None; self.refresh_list(self.entry_search.get())
+    def _get_all_words_cached(self):
+        # 全件は保存・削除・インポート・DB 切替・並べ替えでしか変わらないので、その時だけ取り直す
+        if self._all_words_dirty: self._set_all_words(self.db_manager.get_all_words())
+        return self.data_cache
+    def _set_all_words(self, words):
+        # 一覧の表示文字列は全件を読んだ時に id ごとに作っておき、検索のたびに組み立てない
+        # (term と品詞は更新で変わらないので、同じ DB の間は id で引ける)
+        self.data_cache = words; self._all_words_dirty = False
+        self._list_labels = {item['id']: _list_label(item) for item in words}
     def refresh_list(self, query=""):
-        self.listbox.delete(0, tk.END)
-        self.data_cache = self.db_manager.get_all_words()
-        self.display_items = []
-        query = query.lower(); mode = self.search_mode.get()
-        for item in self.data_cache:
-            w = item['term']; w_l = w.lower(); m = False
-            if not query: m = True
-            elif mode == "contains" and query in w_l: m = True
-            elif mode == "startswith" and w_l.startswith(query): m = True
-            elif mode == "endswith" and w_l.endswith(query): m = True
-            if m:
-                display_str = f"{item['term']} ({item['pos'].split('(')[0]})" 
-                self.listbox.insert(tk.END, display_str)
-                self.display_items.append(item)
+        # 単語の検索はメモリ上の索引 (_term_index)、全文検索だけ FTS5 で絞り込む
+        if query: self.display_items = self.db_manager.search_words(query, self.search_mode.get())
+        else: self.display_items = self._get_all_words_cached()
+        # 前回と同じ結果リストならそのまま、違えば表示済みの行 (最大でも数ページ) だけを先頭から比べ、
+        # 食い違った所から後ろを消して残りは使い回す (DB を切り替えると id が重なるので term・品詞も含めて比べる)
+        items = self.display_items; shown = self._shown_keys
+        if items is not self._shown_src:
+            k = 0; m = min(len(shown), len(items))
+            while k < m and shown[k] == (items[k]['id'], items[k]['term'], items[k]['pos']): k += 1
+            if k < len(shown): self.listbox.delete(k, tk.END); del shown[k:]
+            self._shown_src = items
+        self._fill_list(_LIST_PAGE)
+
+    def _fill_list(self, upto):
+        # 一覧は _LIST_PAGE 件ずつ、スクロールに合わせて足していく
+        have = self.listbox.size(); upto = min(upto, len(self.display_items))
+        if upto <= have: return
+        labels = self._list_labels
+        new = self.display_items[have:upto]
+        display_strs = [labels.get(item['id']) or _list_label(item) for item in new]
+        self.listbox.insert(tk.END, *display_strs)
+        self._shown_keys += [(item['id'], item['term'], item['pos']) for item in new]
+
+    def _on_list_scroll(self, first, last):
+        self._list_sb.set(first, last)
+        if float(last) > 0.9: self._fill_list(self.listbox.size() + _LIST_PAGE)
 
     def show_detail(self, event):
         sel = self.listbox.curselection()
         if not sel: return
         idx = sel[0]
         if idx >= len(self.display_items): return
-        item = self.display_items[idx]
+        item = self.db_manager.get_word(self.display_items[idx]['id'])
+        if item is None: return
         self.lbl_detail_term.config(text=item['term'])
         content = f"【発音】 {item['pronunciation']}\n【品詞】 {item['pos']}\n\n【意味】\n{item['meaning']}\n\n【例文】\n{item['example']}"
         self.detail_text.config(state="normal")
         self.detail_text.delete(1.0, tk.END)
-        pattern = re.compile(r'\[(.*?)\]')
         last_pos = 0
-        for match in pattern.finditer(content):
-            self.detail_text.insert(tk.END, content[last_pos:match.start()])
+        # (文字列, タグ) の組を集めて Text の insert を1回の Tcl 呼び出しで済ませる
+        segments = []
+        for match in _LINK_PATTERN.finditer(content):
+            segments += (content[last_pos:match.start()], ())
             link_word = match.group(1)
-            tag_name = f"link_{link_word}"
-            self.detail_text.insert(tk.END, link_word, ("hyperlink", tag_name))
-            def on_link_click(event, word=link_word): self.jump_to_word_filter(word)
-            self.detail_text.tag_bind(tag_name, "<Button-1>", on_link_click)
-            self.detail_text.tag_bind(tag_name, "<Enter>", lambda e: self.detail_text.config(cursor="hand2"))
-            self.detail_text.tag_bind(tag_name, "<Leave>", lambda e: self.detail_text.config(cursor=""))
+            segments += (link_word, ("hyperlink", f"link_{link_word}"))
             last_pos = match.end()
-        self.detail_text.insert(tk.END, content[last_pos:])
-        self.detail_text.tag_config("hyperlink", foreground=self.colors.get("link_fg", "blue"), underline=1)
+        segments += (content[last_pos:], ())
+        self.detail_text.tk.call(self.detail_text._w, "insert", tk.END, *segments)
+        self.detail_text.tag_config("hyperlink", foreground=self.theme.link_fg, underline=1)
         self.detail_text.config(state="disabled")
         if self.current_mode == "write": self.fill_form(item)
 
@@ -586,21 +900,40 @@ class ReDicSearcherApp:
         data = {k: self.entries[k].get().strip() for k in ["term", "pronunciation", "meaning", "example"]}
         data["pos"] = self.pos_var.get()
         if not data['term']: return self.log("Term required.", "warn")
-        res = self.db_manager.upsert_word(data)
-        self.refresh_list(self.entry_search.get())
+        row, res = self.db_manager.upsert_word(data); self._all_words_dirty = True
+        self._put_in_list(row, res)
         self.log(f"{'Registered' if res=='created' else 'Updated'}: {data['term']}", "success")
     def delete_entry(self):
         term = self.entries["term"].get().strip(); pos = self.pos_var.get()
         if term and messagebox.askyesno("Delete", f"Delete '{term} ({pos})'?"):
-            self.db_manager.delete_word(term, pos); self.clear_form(); self.refresh_list(self.entry_search.get())
+            self.db_manager.delete_word(term, pos); self._all_words_dirty = True; self.clear_form(); self._drop_from_list(term, pos)
             self.log(f"Deleted: {term}", "warn")
+    # 1件の保存・削除では一覧を作り直さず、その行だけを差し替える
+    # (display_items は検索キャッシュと同じリストなので、複製してから書き換える)
+    def _put_in_list(self, row, action):
+        if self.entry_search.get(): return self.refresh_list(self.entry_search.get())   # 絞り込み中は条件に合うか分からない
+        items = self.display_items = list(self.display_items)
+        if action == "created":
+            items.append(row)
+            if self.listbox.size() == len(items) - 1: self._fill_list(len(items))
+        else:
+            for i, it in enumerate(items):
+                if it['id'] == row['id']: items[i] = row; break
+    def _drop_from_list(self, term, pos):
+        items = self.display_items = list(self.display_items)
+        for i, it in enumerate(items):
+            if it['term'] == term and it['pos'] == pos:
+                del items[i]
+                if i < self.listbox.size(): self.listbox.delete(i); del self._shown_keys[i]
+                break
     def fill_form(self, item):
         self.clear_form()
         for k in ["term", "pronunciation", "meaning", "example"]: self.entries[k].insert(0, item[k])
         self.pos_var.set(item['pos'])
     def clear_form(self):
+        if self.frame_write is None: return
         for ent in self.entries.values(): ent.delete(0, tk.END)
-        self.pos_var.set(PART_OF_SPEECH_LIST[0])
+        self.pos_var.set(_POS_TUPLE[0])
     def move_up(self): self._move(-1)
     def move_down(self): self._move(1)
     def _move(self, d):
@@ -609,9 +942,16 @@ class ReDicSearcherApp:
         if not sel: return
         i = sel[0]; ti = i + d
         if 0 <= ti < len(self.display_items):
-            item1 = self.display_items[i]; item2 = self.display_items[ti]
-            self.db_manager.update_order(item1['id'], item2['sort_order'], item2['id'], item1['sort_order'])
-            self.refresh_list(); self.listbox.selection_set(ti); self.listbox.see(ti)
+            items = self.display_items = list(self.display_items)   # 検索キャッシュと共有しているので複製してから書き換える
+            item1 = items[i]; item2 = items[ti]
+            rows = {r['id']: r for r in self.db_manager.update_order(item1['id'], item2['sort_order'], item2['id'], item1['sort_order'])}
+            self._all_words_dirty = True
+            # 一覧は作り直さず、入れ替えた2行だけを差し替える (表示の末尾を跨ぐときは入れ替える前の行まで出しておく)
+            self._fill_list(ti + 1); lo = min(i, ti)
+            items[i], items[ti] = rows[item2['id']], rows[item1['id']]
+            keys = self._shown_keys; keys[i], keys[ti] = keys[ti], keys[i]
+            self.listbox.delete(lo, lo + 1); self.listbox.insert(lo, _list_label(items[lo]), _list_label(items[lo + 1]))
+            self.listbox.selection_set(ti); self.listbox.see(ti)
 
 if __name__ == "__main__":
     try:
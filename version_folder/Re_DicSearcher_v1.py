@@ -4,6 +4,24 @@ import json
 import os
 import sys
 import time
+import bisect
+import threading
+
+# orjson があれば使う (無くても標準の json で動く)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def json_loads(raw):
+    """bytes の JSON を読み込む"""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def json_dumps(obj):
+    """JSON を UTF-8 の bytes で返す (日本語はエスケープしない。orjson は2文字のインデントしか無いのでそれに揃える)"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
 
 # --- 設定・定数 (Black & Lime Green) ---
 DEFAULT_FILE = "dictionary_data.json"
@@ -24,6 +42,9 @@ FONT_BOLD = ("Consolas", 11, "bold")
 FONT_TITLE = ("Consolas", 14, "bold")
 FONT_LOG = ("Consolas", 10)
 
+# リストの1ページ分の件数
+LIST_PAGE = 500
+
 # 品詞リスト
 PART_OF_SPEECH_LIST = [
     "N(名詞)", "V(動詞)", "Adj(形容詞)", "Adv(副詞)", 
@@ -49,11 +70,25 @@ class ModernDictApp:
 
         # データ管理
         self.data = {} 
+        self._order = [] # 表示順の単語リスト (並び替えはここで入れ替えるだけ。data は検索用の辞書)
+        self._keys_lower = [] # (単語, casefold した単語) の一覧。検索のたびに変換しないためのキャッシュ
+        self._index_dirty = True # True なら次の検索の前に検索用インデックスを作り直す
         self.filepath = DEFAULT_FILE
         self.current_mode = "read" 
         
         # ★追加: 検索モード管理変数
         self.search_mode = tk.StringVar(value="contains") # contains, startswith, endswith
+        self._search_after_id = None # 検索の遅延実行 (after) の ID
+        self._filtered = []          # 現在の検索結果 (一覧にはこの先頭から必要な分だけ入れる)
+        self._detail_cache = {}      # 単語 → 詳細欄に表示する文字列
+        self._last_detail_word = None # 詳細欄に今表示している単語
+        self._dirty = False          # 未保存の変更があるか
+        self._save_after_id = None   # 保存の遅延実行 (after) の ID
+        self._save_lock = threading.Lock() # ファイル書き込みを1本にするためのロック
+        self._save_gen = 0           # 保存内容を確定するたびに増やす番号
+        self._written_gen = {}       # ファイル → 書き込み済みの番号 (それより古い内容では上書きしない)
+        self._save_threads = []      # 書き込み中・順番待ちのスレッド
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # スプラッシュスクリーン表示
         self.show_splash()
@@ -80,44 +115,55 @@ class ModernDictApp:
         content = tk.Frame(splash, bg=COLOR_BG)
         content.pack(expand=True)
         
-        try:
-            # 画像があれば表示 (Pillowが必要)
-            from PIL import Image, ImageTk
-            img_path = resource_path("logo.png")
-            if os.path.exists(img_path):
-                raw_img = Image.open(img_path)
-                raw_img.thumbnail((120, 120))
-                img = ImageTk.PhotoImage(raw_img)
-                lbl = tk.Label(content, image=img, bg=COLOR_BG)
-                lbl.image = img
-                lbl.pack(pady=10)
-            else:
-                tk.Label(content, text="📚", font=("Segoe UI Emoji", 60), bg=COLOR_BG, fg=COLOR_FG).pack()
-        except:
-            tk.Label(content, text="[DICTIONARY]", font=FONT_TITLE, bg=COLOR_BG, fg=COLOR_FG).pack(pady=10)
-
-        tk.Label(content, text="INITIALIZING SYSTEM...", font=FONT_BOLD, bg=COLOR_BG, fg=COLOR_FG).pack(pady=5)
+        img_path = resource_path("logo.png")
+        if not os.path.exists(img_path):
+            tk.Label(content, text="📚", font=("Segoe UI Emoji", 60), bg=COLOR_BG, fg=COLOR_FG).pack()
+
+        title_lbl = tk.Label(content, text="INITIALIZING SYSTEM...", font=FONT_BOLD, bg=COLOR_BG, fg=COLOR_FG)
+        title_lbl.pack(pady=5)
+        if os.path.exists(img_path):
+            # Pillow の import は重いので、先に画面を出してから読み込む
+            splash.after(10, self.load_splash_logo, content, title_lbl, img_path)
         
-        # プログレスバー風アニメーション
-        self.loading_lbl = tk.Label(content, text="", font=("Consolas", 10), bg=COLOR_BG, fg=COLOR_FG)
-        self.loading_lbl.pack()
+        # プログレスバー (アニメーションは Tk 側で回るので Python からは開始・停止だけ)
+        tk.Label(content, text="LOADING DATA MODULE", font=("Consolas", 10), bg=COLOR_BG, fg=COLOR_FG).pack()
+        style = ttk.Style(splash)
+        style.configure("Splash.Horizontal.TProgressbar", background=COLOR_FG, troughcolor=COLOR_BG)
+        pb = ttk.Progressbar(content, mode="indeterminate", length=200, style="Splash.Horizontal.TProgressbar")
+        pb.pack(pady=5)
+        pb.start(80)
+
+        # アニメーションの裏でデータを読み込んでおく (Tk にはメインスレッドからしか触らない)
+        self._preloaded = None
+        self._preload_done = threading.Event()
+        threading.Thread(target=self._bg_load, args=(self.filepath,), daemon=True).start()
 
         def finish_load():
+            if not self._preload_done.is_set(): # 約1.5秒経っても読み込みが終わっていなければ待つ
+                splash.after(50, finish_load)
+                return
+            pb.stop()
             splash.destroy()
             self.root.deiconify() # メインウィンドウ表示
             self.setup_ui()       # UI構築
-            self.load_data_logic(self.filepath) # データ読み込み
-
-        # 簡易アニメーション
-        def update_loading(count=0):
-            chars = ["|", "/", "-", "\\"]
-            self.loading_lbl.config(text=f"LOADING DATA MODULE {chars[count % 4]}")
-            if count < 15: # 約1.5秒
-                splash.after(100, update_loading, count+1)
-            else:
-                finish_load()
+            self.load_data_logic(self.filepath, self._preloaded) # 読み込み済みのデータを反映
+            self._preloaded = None
 
-        update_loading()
+        splash.after(1500, finish_load)
+
+    def load_splash_logo(self, content, title_lbl, img_path):
+        """起動画面のロゴ画像を表示 (Pillowが必要)"""
+        try:
+            from PIL import Image, ImageTk
+        except ImportError:
+            tk.Label(content, text="[DICTIONARY]", font=FONT_TITLE, bg=COLOR_BG, fg=COLOR_FG).pack(before=title_lbl, pady=10)
+            return
+        raw_img = Image.open(img_path)
+        raw_img.thumbnail((120, 120))
+        img = ImageTk.PhotoImage(raw_img)
+        lbl = tk.Label(content, image=img, bg=COLOR_BG)
+        lbl.image = img
+        lbl.pack(before=title_lbl, pady=10)
 
     def setup_ui(self):
         # --- 1. ヘッダー (ファイル & モード) ---
@@ -157,6 +203,11 @@ class ModernDictApp:
         self.log_text = tk.Text(log_container, height=4, bg="#050505", fg=COLOR_FG, 
                                 font=FONT_LOG, state="disabled", relief="solid", bd=1)
         self.log_text.pack(fill=tk.X)
+        # ログの色分けタグ (色は変わらないので作成時に1回だけ設定)
+        self.log_text.tag_config("info", foreground=COLOR_FG)
+        self.log_text.tag_config("error", foreground="red")
+        self.log_text.tag_config("warn", foreground="yellow")
+        self.log_text.tag_config("success", foreground="#AAFFAA")
         
         # 起動メッセージ
         self.log("System initialized. Ready.")
@@ -208,9 +259,9 @@ class ModernDictApp:
         self.listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.listbox.bind('<<ListboxSelect>>', self.show_detail)
 
-        sb = tk.Scrollbar(left_group, orient=tk.VERTICAL, command=self.listbox.yview)
-        sb.pack(side=tk.RIGHT, fill=tk.Y)
-        self.listbox.config(yscrollcommand=sb.set)
+        self.list_sb = tk.Scrollbar(left_group, orient=tk.VERTICAL, command=self.listbox.yview)
+        self.list_sb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox.config(yscrollcommand=self.on_list_scroll)
 
         # 右：詳細
         detail_frame = tk.Frame(paned, bg=COLOR_BG, padx=15)
@@ -278,13 +329,7 @@ class ModernDictApp:
         elif level == "warn": tag = "warn"
         elif level == "success": tag = "success"
 
-        self.log_text.tag_config("info", foreground=COLOR_FG)
-        self.log_text.tag_config("error", foreground="red")
-        self.log_text.tag_config("warn", foreground="yellow")
-        self.log_text.tag_config("success", foreground="#AAFFAA")
-
-        self.log_text.insert(tk.END, f"{timestamp} ", "info")
-        self.log_text.insert(tk.END, f"{message}\n", tag)
+        self.log_text.insert(tk.END, f"{timestamp} ", "info", f"{message}\n", tag)
         self.log_text.see(tk.END) 
         self.log_text.config(state="disabled")
 
@@ -298,18 +343,41 @@ class ModernDictApp:
         if filename:
             self.load_data_logic(filename)
 
-    def load_data_logic(self, filepath):
+    def _bg_load(self, filepath):
+        """スプラッシュ表示中にワーカースレッドで読み込む"""
+        self._preloaded = self.read_file(filepath)
+        self._preload_done.set()
+
+    @staticmethod
+    def read_file(filepath):
+        """JSON を読み込んで (成否, 中身) を返す (ファイルが無ければ (True, None)、失敗したら (False, 例外))"""
         if not os.path.exists(filepath):
+            return True, None
+        try:
+            with open(filepath, 'rb') as f:
+                return True, json_loads(f.read())
+        except Exception as e:
+            return False, e
+
+    def load_data_logic(self, filepath, loaded=None):
+        self.flush_save_sync() # 切り替え前のファイルへの保存を済ませておく
+        self._detail_cache.clear()
+        self._last_detail_word = None
+        if loaded is None: # 先読みしたものが無ければここで読む
+            loaded = self.read_file(filepath)
+        ok, content = loaded
+        if not ok:
+            return self._load_failed(content)
+        if content is None:
             self.log(f"File not found: {os.path.basename(filepath)}. Starting new.", "warn")
             self.data = {}
+            self._order = []
+            self._index_dirty = True
             self.filepath = filepath
             self.lbl_filename.config(text=f"[{os.path.basename(filepath)}]")
             return
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = json.load(f)
-
             if isinstance(content, list):
                 self.data = {}
                 for item in content:
@@ -325,6 +393,8 @@ class ModernDictApp:
                 self.data = content
             else:
                 self.data = {}
+            self._order = list(self.data)
+            self._index_dirty = True
 
             self.filepath = filepath
             self.lbl_filename.config(text=f"[{os.path.basename(filepath)}]")
@@ -332,42 +402,165 @@ class ModernDictApp:
             self.refresh_list()
         
         except Exception as e:
-            self.log(f"Load Error: {e}", "error")
-            self.data = {}
+            self._load_failed(e)
+
+    def _load_failed(self, e):
+        self.log(f"Load Error: {e}", "error")
+        self.data = {}
+        self._order = []
+        self._index_dirty = True
 
     def save_data(self):
+        """保存を予約する (500ms 以内の連続した変更は1回の書き込みにまとめる)"""
+        self._dirty = True
+        if self._save_after_id: self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._flush_save)
+
+    def _flush_save(self):
+        """予約された保存をワーカースレッドで実行する"""
+        self._save_after_id = None
+        if not self._dirty: return
+        # 書き出す内容はメインスレッドで確定させる (スレッド側では self.data を触らない)
+        path, gen, snapshot = self._take_snapshot()
+        result = {}
+        def work():
+            with self._save_lock: result["error"] = self._write_snapshot(path, gen, snapshot)
+        t = threading.Thread(target=work, daemon=True)
+        self._save_threads.append(t)
+        t.start()
+        self._report_save(t, result, path)
+
+    def _take_snapshot(self):
+        self._dirty = False
+        self._save_gen += 1
+        return self.filepath, self._save_gen, {k: self.data[k] for k in self._order}
+
+    def _write_snapshot(self, path, gen, snapshot):
+        """_save_lock を持った状態で呼ぶ。ロックの取得順は保証されないので、後から確定した内容が書き込み済みなら何もしない"""
+        if gen <= self._written_gen.get(path, 0): return None
+        e = self._save_data_now(path, snapshot)
+        if not e: self._written_gen[path] = gen
+        return e
+
+    def _report_save(self, t, result, path):
+        """書き込みスレッドの終了を待ってログに出す (Tk はメインスレッドからしか触れない)"""
+        if t.is_alive():
+            self.root.after(100, self._report_save, t, result, path)
+            return
+        if t in self._save_threads: self._save_threads.remove(t)
+        if result.get("error"):
+            self.log(f"Save Error: {result['error']}", "error")
+        else:
+            self.log(f"Data saved to {os.path.basename(path)}", "success")
+
+    def _save_data_now(self, path, snapshot):
+        """一時ファイルに書いてから置き換える (失敗したら例外を返す)"""
         try:
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, ensure_ascii=False, indent=4)
-            self.log(f"Data saved to {os.path.basename(self.filepath)}", "success")
+            data = json_dumps(snapshot)
+            tmp = path + ".tmp"
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path) # 書き込み途中で落ちても元のファイルは壊れない
         except Exception as e:
-            self.log(f"Save Error: {e}", "error")
+            return e
+
+    def flush_save_sync(self):
+        """予約中の保存があればその場で書き込む (終了時・ファイル切り替え前)"""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        if self._dirty:
+            path, gen, snapshot = self._take_snapshot()
+            with self._save_lock: # 走っている書き込みスレッドがあれば終わるのを待つ
+                e = self._write_snapshot(path, gen, snapshot)
+            if e: self.log(f"Save Error: {e}", "error")
+        # 順番待ちのスレッドも終わらせる (デーモンなので終了時に途中で止められないように。古い内容なら書かずに抜ける)
+        for t in self._save_threads: t.join()
+
+    def on_close(self):
+        """未保存の変更を書き出してから終了する"""
+        self.flush_save_sync()
+        self.root.destroy()
 
     # =========================================
     # 並び替え & リスト操作 (★検索ロジック更新)
     # =========================================
+    def rebuild_index(self):
+        """検索用の小文字キー一覧を作り直す (読み込み・登録・削除・並び替えの後、次の検索の前に呼ばれる)"""
+        self._index_dirty = False
+        # lower() ではなく casefold() で揃える (ß と ss、ſ と s なども同じ文字として扱う)
+        self._keys_lower = [(k, k.casefold()) for k in self._order]
+        # 前方一致用: (小文字キー, 表示順) を小文字キー順に並べたもの。bisect で範囲を引く
+        self._sorted_lower = sorted((wl, i) for i, (_, wl) in enumerate(self._keys_lower))
+        self._sorted_lower_keys = [wl for wl, _ in self._sorted_lower]
+        # 部分一致用: 全キーを \0 区切りで1本のバイト列にしたものと、各キーの先頭位置
+        encoded = [wl.encode("utf-8", "surrogatepass") for _, wl in self._keys_lower]
+        self._joined_lower = b"\x00".join(encoded)
+        self._joined_starts = []
+        pos = 0
+        for b in encoded:
+            self._joined_starts.append(pos)
+            pos += len(b) + 1
+        self._joined_starts.append(pos)
+        # 2文字以上の部分一致用: 連続する2文字 → それを含むキーの表示順 の転置索引
+        self._bigram_index = {}
+        for i, (_, wl) in enumerate(self._keys_lower):
+            for j in range(len(wl) - 1):
+                self._bigram_index.setdefault(wl[j:j+2], set()).add(i)
+
     def refresh_list(self, query=""):
-        self.listbox.delete(0, tk.END)
-        query = query.lower()
+        if self._index_dirty: self.rebuild_index()
+        query = query.casefold()
         mode = self.search_mode.get() # 現在の検索モード取得
+        matches = []
         
-        # 辞書のキー順序（挿入順・並び替え後）に従って表示
-        for word in self.data.keys():
-            w_lower = word.lower()
-            match = False
-            
-            # 検索ロジック分岐
-            if not query:
-                match = True
-            elif mode == "contains" and query in w_lower:
-                match = True
-            elif mode == "startswith" and w_lower.startswith(query):
-                match = True
-            elif mode == "endswith" and w_lower.endswith(query):
-                match = True
-            
-            if match:
-                self.listbox.insert(tk.END, word)
+        if query and mode == "startswith":
+            # 前方一致は整列済みキーの二分探索で該当範囲だけを取り出し、表示順に戻す
+            lo = bisect.bisect_left(self._sorted_lower_keys, query)
+            hi = bisect.bisect_left(self._sorted_lower_keys, query + "\U0010ffff", lo)
+            hits = sorted(i for _, i in self._sorted_lower[lo:hi])
+            matches = [self._keys_lower[i][0] for i in hits]
+        elif query and mode == "contains" and len(query) >= 2:
+            # 2文字以上なら、クエリ中の2文字組をすべて含むキーだけを候補にして (小さい集合から積を取る)
+            # 本当に含むかを確かめる
+            postings = sorted((self._bigram_index.get(query[j:j+2], ()) for j in range(len(query) - 1)), key=len)
+            hits = set(postings[0]).intersection(*postings[1:])
+            matches = [self._keys_lower[i][0] for i in sorted(hits) if query in self._keys_lower[i][1]]
+        elif query and mode == "contains":
+            # 1文字ならつないだバイト列を find (C 実装の高速探索) で一気に走査し、
+            # 見つかった位置から bisect で何番目のキーかを割り出す
+            q = query.encode("utf-8", "surrogatepass")
+            if b"\x00" not in q:
+                find = self._joined_lower.find
+                starts = self._joined_starts
+                i = find(q)
+                while i != -1:
+                    row = bisect.bisect_right(starts, i) - 1
+                    matches.append(self._keys_lower[row][0])
+                    i = find(q, starts[row + 1]) # 次のキーの先頭から探し直す
+        elif not query:
+            # 辞書のキー順序（挿入順・並び替え後）に従って表示
+            matches = [word for word, _ in self._keys_lower]
+        elif mode == "endswith":
+            # モードの判定はループの外で1回だけ済ませ、ループ内は endswith の呼び出しだけにする
+            matches = [word for word, w_lower in self._keys_lower if w_lower.endswith(query)]
+
+        self._filtered = matches
+        self.listbox.delete(0, tk.END)
+        self.fill_list(LIST_PAGE)
+
+    def fill_list(self, upto):
+        """検索結果をリストに追加 (upto 件目まで)"""
+        have = self.listbox.size()
+        upto = min(upto, len(self._filtered))
+        if upto > have:
+            self.listbox.insert(tk.END, *self._filtered[have:upto])
+
+    def on_list_scroll(self, first, last):
+        """スクロールが下端に近づいたら次のページを追加"""
+        self.list_sb.set(first, last)
+        if float(last) > 0.9:
+            self.fill_list(self.listbox.size() + LIST_PAGE)
 
     def move_up(self):
         """選択した単語を一つ上に移動"""
@@ -380,16 +573,10 @@ class ModernDictApp:
         idx = sel[0]
         
         if idx > 0:
-            keys = list(self.data.keys())
-            keys[idx], keys[idx-1] = keys[idx-1], keys[idx]
-            new_data = {k: self.data[k] for k in keys}
-            self.data = new_data
-            
-            self.save_data() 
-            self.refresh_list()
+            self.swap_order(idx - 1, idx)
             self.listbox.selection_set(idx-1)
             self.listbox.see(idx-1)
-            self.log(f"Moved '{keys[idx-1]}' up.", "info")
+            self.log(f"Moved '{self._order[idx-1]}' up.", "info")
 
     def move_down(self):
         """選択した単語を一つ下に移動"""
@@ -400,22 +587,30 @@ class ModernDictApp:
         sel = self.listbox.curselection()
         if not sel: return
         idx = sel[0]
-        keys = list(self.data.keys())
 
-        if idx < len(keys) - 1:
-            keys[idx], keys[idx+1] = keys[idx+1], keys[idx]
-            new_data = {k: self.data[k] for k in keys}
-            self.data = new_data
-            
-            self.save_data()
-            self.refresh_list()
+        if idx < len(self._order) - 1:
+            self.swap_order(idx, idx + 1)
             self.listbox.selection_set(idx+1)
             self.listbox.see(idx+1)
-            self.log(f"Moved '{keys[idx+1]}' down.", "info")
+            self.log(f"Moved '{self._order[idx+1]}' down.", "info")
+
+    def swap_order(self, i, j):
+        """表示順の隣り合う2語 (i < j) を入れ替え、リストもその2行だけ書き換える"""
+        self._order[i], self._order[j] = self._order[j], self._order[i]
+        self._filtered[i], self._filtered[j] = self._filtered[j], self._filtered[i]
+        self._index_dirty = True
+        self.save_data()
+        self.listbox.delete(i, j)
+        self.listbox.insert(i, self._order[i], self._order[j])
 
     # =========================================
     # 編集・削除
     # =========================================
+    def forget_detail(self, term):
+        """登録・削除した単語の詳細表示キャッシュを捨てる"""
+        self._detail_cache.pop(term, None)
+        if term == self._last_detail_word: self._last_detail_word = None
+
     def save_entry(self):
         term = self.entries["term"].get().strip()
         if not term:
@@ -430,6 +625,10 @@ class ModernDictApp:
             "meaning": self.entries["meaning"].get().strip(),
             "example": self.entries["example"].get().strip()
         }
+        if is_new:
+            self._order.append(term)
+            self._index_dirty = True
+        self.forget_detail(term)
         
         self.save_data()
         self.refresh_list(self.entry_search.get())
@@ -443,6 +642,9 @@ class ModernDictApp:
         term = self.entries["term"].get().strip()
         if term in self.data:
             del self.data[term]
+            self._order.remove(term)
+            self._index_dirty = True
+            self.forget_detail(term)
             self.save_data()
             self.clear_form()
             self.refresh_list(self.entry_search.get())
@@ -451,21 +653,33 @@ class ModernDictApp:
             self.log("Term not found to delete.", "error")
 
     def on_search(self, event=None):
+        """連続したキー入力は最後の入力から 130ms 後に1回だけ検索する"""
+        if self._search_after_id: self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(130, self.run_search)
+
+    def run_search(self):
+        self._search_after_id = None
         self.refresh_list(self.entry_search.get())
 
     def show_detail(self, event):
         sel = self.listbox.curselection()
         if not sel: return
         word = self.listbox.get(sel[0])
-        d = self.data.get(word, {})
 
-        self.lbl_detail_term.config(text=word)
-        content = f"【発音】 {d.get('pronunciation','')}\n【品詞】 {d.get('pos','')}\n\n【意味】\n{d.get('meaning','')}\n\n【例文】\n{d.get('example','')}"
-        
-        self.detail_text.config(state="normal")
-        self.detail_text.delete(1.0, tk.END)
-        self.detail_text.insert(tk.END, content)
-        self.detail_text.config(state="disabled")
+        # 同じ単語を選び直しただけなら詳細欄は書き換えない
+        if word != self._last_detail_word:
+            self._last_detail_word = word
+            content = self._detail_cache.get(word)
+            if content is None:
+                d = self.data.get(word, {})
+                content = f"【発音】 {d.get('pronunciation','')}\n【品詞】 {d.get('pos','')}\n\n【意味】\n{d.get('meaning','')}\n\n【例文】\n{d.get('example','')}"
+                self._detail_cache[word] = content
+
+            self.lbl_detail_term.config(text=word)
+            self.detail_text.config(state="normal")
+            self.detail_text.delete(1.0, tk.END)
+            self.detail_text.insert(tk.END, content)
+            self.detail_text.config(state="disabled")
 
         if self.current_mode == "write":
             self.fill_form(word)
@@ -5,6 +5,11 @@ import json
 import os
 import sys
 import time
+import atexit
+import bisect
+import collections
+import itertools
+import threading
 
 # ==========================================
 #  設定・テーマ定義
@@ -41,12 +46,30 @@ THEMES = {
     }
 }
 
+# ログ背景・警告色・CLEAR ボタンはテーマ名で分けていたので、ここでテーマごとに持たせる
+THEME_EXTRA = {
+    "Dark": {"log_bg": "#050505", "log_fg_warn": "#FFD700", "form_clear_bg": "#444444"},
+    "Light": {"log_bg": "#FFFFFF", "log_fg_warn": "#FF8C00", "form_clear_bg": "#AAAAAA"},
+}
+# apply_theme_to_widgets では属性で引く (self.theme.bg など)
+ThemeResolved = collections.namedtuple("ThemeResolved", [*THEMES["Dark"], *THEME_EXTRA["Dark"]])
+THEMES_RESOLVED = {name: ThemeResolved(**THEMES[name], **THEME_EXTRA[name]) for name in THEMES}
+
 PART_OF_SPEECH_LIST = [
     "N(名詞)", "V(動詞)", "Adj(形容詞)", "Adv(副詞)", 
     "Conj(接続詞)", "Prep(前置詞)", "Pro(代名詞)", 
     "Det(限定詞)", "Aux(助動詞)", "Part(助詞)", "Num(数詞)", "Other"
 ]
 
+# 検索結果を覚えておく件数
+SEARCH_CACHE_SIZE = 128
+
+# Listbox に先に入れておく単語数 (続きは on_list_scroll で追加)
+LIST_PAGE = 500
+
+# 検索欄の KeyRelease で無視するキー
+MODIFIER_KEYS = {"Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R", "Meta_L", "Meta_R"}
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -60,10 +83,31 @@ def resource_path(relative_path):
 class DatabaseManager:
     def __init__(self, db_file):
         self.db_file = db_file
+        self.conn = None
+        self._index = None     # 検索用: (全件の行, 小文字化した単語, 反転して整列した単語, その行番号)
+        self._index_ver = None # _index を作ったときの DB のバージョン
+        self.connect()
+        atexit.register(self.close)
         self.init_db()
 
+    def connect(self):
+        # 接続は起動時に1本だけ開いて使い回す (操作のたびに開き直さない)
+        # 起動時の読み込みだけはワーカースレッドから使う (その間メインスレッドは DB に触らない)
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row # 行は名前でも番号でも引ける (行ごとに dict を作らない)
+        # 書き込みより検索が圧倒的に多いので、キャッシュと mmap を大きめに取る
+        for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY",
+                       "cache_size=-65536", "mmap_size=268435456"):
+            self.conn.execute(f"PRAGMA {pragma}")
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
     def get_connection(self):
-        return sqlite3.connect(self.db_file)
+        # with で使うとコミット/ロールバックだけ行われ、接続は閉じない
+        return self.conn
 
     def init_db(self):
         with self.get_connection() as conn:
@@ -85,45 +129,97 @@ class DatabaseManager:
                     value TEXT
                 )
             """)
+            # 一覧は常に sort_order 順で取り出すので索引を張っておく
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sort ON dictionary(sort_order)")
             conn.commit()
 
     def get_all_words(self):
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM dictionary ORDER BY sort_order ASC")
-            columns = [col[0] for col in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            return cursor.fetchall()
+
+    def word_index(self):
+        """全件の行と小文字化した単語、前方一致・後方一致用にそれ (と反転したもの) を整列したキーと行番号。
+        DB が変わったときだけ作り直す
+        (data_version は他の接続のコミットでしか変わらないので、自分の変更数 total_changes と組で見る)"""
+        ver = (self.conn.execute("PRAGMA data_version").fetchone()[0], self.conn.total_changes)
+        if ver != self._index_ver:
+            rows = self.get_all_words()
+            terms = [row['term'].lower() for row in rows]
+            fwd = sorted((t, i) for i, t in enumerate(terms))
+            rev = sorted((t[::-1], i) for i, t in enumerate(terms))
+            self._index = (rows, terms, [k for k, _ in fwd], [i for _, i in fwd], [k for k, _ in rev], [i for _, i in rev])
+            self._index_ver = ver
+        return self._index
+
+    def search(self, query, mode):
+        """単語の絞り込み。大文字小文字は他のバージョンと同じく str.lower で同一視する
+        (SQLite の LIKE は ASCII しか同一視しないので使わない)"""
+        rows, terms, keys, key_rows, rev_keys, rev_rows = self.word_index()
+        q = query.lower()
+        # 前方一致は整列したキーの範囲を二分探索で引き、後方一致は反転した検索語の前方一致として同じように引く
+        if mode == "startswith": return [rows[i] for i in sorted(self.key_range(keys, key_rows, q))]
+        if mode == "endswith": return [rows[i] for i in sorted(self.key_range(rev_keys, rev_rows, q[::-1]))]
+        return [row for row, t in zip(rows, terms) if q in t]
+
+    @staticmethod
+    def key_range(keys, key_rows, q):
+        """q で始まるキーの行番号 (並びは sort_order 順ではない)"""
+        lo = bisect.bisect_left(keys, q)
+        return key_rows[lo:bisect.bisect_left(keys, q + "\U0010ffff", lo)]
+
+    def term_matches(self, term, query, mode):
+        """1語が search() の条件に合うか"""
+        return self.matcher(query, mode)(term.lower())
+
+    @staticmethod
+    def matcher(query, mode):
+        q = query.lower()
+        if mode == "startswith": return lambda t: t.startswith(q)
+        if mode == "endswith": return lambda t: t.endswith(q)
+        return lambda t: q in t
 
     def upsert_word(self, data):
+        """戻り値: (保存後の行, "created" / "updated")
+        登録済みの単語なら UPDATE の1文で済ませ、行が無かったときだけ INSERT する
+        (ON CONFLICT 付きの INSERT は衝突しても AUTOINCREMENT の id を消費するので使わない)"""
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM dictionary WHERE term = ?", (data['term'],))
-            exists = cursor.fetchone()
-            if exists:
-                cursor.execute("""
-                    UPDATE dictionary SET pronunciation=?, pos=?, meaning=?, example=? WHERE term=?
-                """, (data['pronunciation'], data['pos'], data['meaning'], data['example'], data['term']))
-                return "updated"
-            else:
-                cursor.execute("SELECT MAX(sort_order) FROM dictionary")
-                max_order = cursor.fetchone()[0]
-                new_order = 1 if max_order is None else max_order + 1
-                cursor.execute("""
-                    INSERT INTO dictionary (term, pronunciation, pos, meaning, example, sort_order)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (data['term'], data['pronunciation'], data['pos'], data['meaning'], data['example'], new_order))
-                return "created"
+            row = conn.execute("""
+                UPDATE dictionary SET pronunciation=?, pos=?, meaning=?, example=? WHERE term=?
+                RETURNING *
+            """, (data['pronunciation'], data['pos'], data['meaning'], data['example'], data['term'])).fetchone()
+            if row: return row, "updated"
+            return conn.execute("""
+                INSERT INTO dictionary (term, pronunciation, pos, meaning, example, sort_order)
+                VALUES (?, ?, ?, ?, ?, COALESCE((SELECT MAX(sort_order) + 1 FROM dictionary), 1))
+                RETURNING *
+            """, (data['term'], data['pronunciation'], data['pos'], data['meaning'], data['example'])).fetchone(), "created"
+
+    def upsert_many(self, rows):
+        """rows: (term, pronunciation, pos, meaning, example) のリスト。インポート全体を1トランザクション (コミット1回) で書く
+        executemany では1行ごとに MAX(sort_order) が再評価されるので新規の単語は順に末尾へ並ぶ"""
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO dictionary (term, pronunciation, pos, meaning, example, sort_order)
+                VALUES (?, ?, ?, ?, ?, COALESCE((SELECT MAX(sort_order) + 1 FROM dictionary), 1))
+                ON CONFLICT(term) DO UPDATE SET
+                    pronunciation=excluded.pronunciation, pos=excluded.pos, meaning=excluded.meaning, example=excluded.example
+            """, rows)
 
     def delete_word(self, term):
         with self.get_connection() as conn:
             conn.execute("DELETE FROM dictionary WHERE term = ?", (term,))
 
     def update_order(self, term1, order1, term2, order2):
+        # 2語の入れ替えを1文で済ませる。戻り値は更新後の2行 (term → 行)
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("UPDATE dictionary SET sort_order = ? WHERE term = ?", (order1, term1))
-            cursor.execute("UPDATE dictionary SET sort_order = ? WHERE term = ?", (order2, term2))
-            conn.commit()
+            rows = conn.execute("""
+                UPDATE dictionary SET sort_order = CASE term WHEN ? THEN ? WHEN ? THEN ? END
+                WHERE term IN (?, ?)
+                RETURNING *
+            """, (term1, order1, term2, order2, term1, term2)).fetchall()
+            return {row['term']: row for row in rows}
 
     def get_setting(self, key, default=None):
         with self.get_connection() as conn:
@@ -132,6 +228,10 @@ class DatabaseManager:
             res = cursor.fetchone()
             return res[0] if res else default
 
+    def get_all_settings(self):
+        with self.get_connection() as conn:
+            return dict(conn.execute("SELECT key, value FROM settings").fetchall())
+
     def set_setting(self, key, value):
         with self.get_connection() as conn:
             conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value))
@@ -147,14 +247,21 @@ class ReDicSearcherApp:
 
         self.db = DatabaseManager(DB_FILE)
         
-        # 設定ロード
-        self.current_theme_name = self.db.get_setting("theme", "Dark")
-        self.splash_style = self.db.get_setting("splash_style", "Classic") # Default to Classic (v1.0 style)
+        # 設定ロード (1回のクエリでまとめて読む)
+        settings = self.db.get_all_settings()
+        self.current_theme_name = settings.get("theme", "Dark")
+        self.splash_style = settings.get("splash_style", "Classic") # Default to Classic (v1.0 style)
         
         self.colors = THEMES[self.current_theme_name]
+        self.theme = THEMES_RESOLVED[self.current_theme_name]
         self.search_mode = tk.StringVar(value="contains")
         self.data_cache = []
         self.widgets = {}
+        self._search_after_id = None # 検索の遅延実行 (after) の ID
+        self._last_search = None     # 最後に実行した (検索語, モード)
+        self._list_terms = []        # 一覧に今表示している単語
+        # 直近の検索結果 (LRU): (検索語, モード) → (行, 単語)。単語の登録・削除・並び替え・インポートで空にする
+        self._search_cache = collections.OrderedDict()
         
         self.apply_theme_to_root()
         self.show_splash()
@@ -167,6 +274,11 @@ class ReDicSearcherApp:
     #  スプラッシュスクリーン分岐
     # ==========================================
     def show_splash(self):
+        # スプラッシュ表示中に重い処理をワーカースレッドで進めておく
+        self._splash_logo = None
+        self._startup_words = None
+        self._startup_done = threading.Event()
+        threading.Thread(target=self._bg_startup, daemon=True).start()
         if self.splash_style == "Modern":
             self.show_splash_modern()
         else:
@@ -183,26 +295,26 @@ class ReDicSearcherApp:
         splash.geometry(f"{w}x{h}+{x}+{y}")
         splash.configure(bg=self.colors["bg"])
 
-        try:
-            from PIL import Image, ImageTk
-            img_path = resource_path("logo.png")
-            if os.path.exists(img_path):
-                raw = Image.open(img_path)
-                raw.thumbnail((100, 100))
-                img = ImageTk.PhotoImage(raw)
-                lbl = tk.Label(splash, image=img, bg=self.colors["bg"])
-                lbl.image = img
-                lbl.pack(pady=20)
-            else:
-                raise Exception
-        except:
-            tk.Label(splash, text="Re.Dic", font=("Consolas", 40, "bold"), 
-                     bg=self.colors["bg"], fg=self.colors["fg"]).pack(pady=20)
+        # ロゴはワーカースレッドで読めたら差し替える。それまで (Pillow が無ければずっと) 文字で表示
+        lbl_logo = tk.Label(splash, text="Re.Dic", font=("Consolas", 40, "bold"), 
+                            bg=self.colors["bg"], fg=self.colors["fg"])
+        lbl_logo.pack(pady=20)
 
         tk.Label(splash, text="LOADING SYSTEM...", font=("Consolas", 10), 
                  bg=self.colors["bg"], fg=self.colors["fg"]).pack(side=tk.BOTTOM, pady=20)
-        
-        splash.after(1500, lambda: self.startup_sequence(splash))
+
+        def wait_for_startup():
+            if self._splash_logo is not None and lbl_logo.image is None:
+                from PIL import ImageTk # PhotoImage は Tk を触るのでメインスレッドで作る
+                lbl_logo.image = ImageTk.PhotoImage(self._splash_logo)
+                lbl_logo.config(image=lbl_logo.image, text="")
+            if self._startup_done.is_set():
+                self.startup_sequence(splash) # 読み込みが終わったらすぐに閉じる
+            else:
+                splash.after(50, wait_for_startup)
+
+        lbl_logo.image = None
+        splash.after(50, wait_for_startup)
 
     def show_splash_classic(self):
         """v1.0風: ハッカー風アニメーション付き起動画面"""
@@ -215,11 +327,8 @@ class ReDicSearcherApp:
         splash.geometry(f"{w}x{h}+{x}+{y}")
         splash.configure(bg=self.colors["bg"])
 
-        # 枠線演出
-        tk.Frame(splash, bg=self.colors["fg"], width=w, height=2).pack(side=tk.TOP)
-        tk.Frame(splash, bg=self.colors["fg"], width=w, height=2).pack(side=tk.BOTTOM)
-        tk.Frame(splash, bg=self.colors["fg"], width=2, height=h).place(x=0, y=0)
-        tk.Frame(splash, bg=self.colors["fg"], width=2, height=h).place(x=w-2, y=0)
+        # 枠線演出 (ウィンドウ自体のハイライト枠で描く)
+        splash.configure(highlightthickness=2, highlightbackground=self.colors["fg"], highlightcolor=self.colors["fg"])
 
         content = tk.Frame(splash, bg=self.colors["bg"])
         content.pack(expand=True)
@@ -232,19 +341,40 @@ class ReDicSearcherApp:
         loading_lbl = tk.Label(content, text="", font=("Consolas", 12), bg=self.colors["bg"], fg=self.colors["fg"])
         loading_lbl.pack(pady=10)
 
-        def update_loading(count=0):
-            chars = ["|", "/", "-", "\\"]
-            loading_lbl.config(text=f"LOADING MODULES {chars[count % 4]}")
-            if count < 18: 
-                splash.after(80, update_loading, count+1)
-            else:
+        spinner = itertools.cycle("|/-\\")
+        def update_loading():
+            # 読み込みが終わるまでだけ回し、終わったらすぐに閉じる
+            if self._startup_done.is_set():
                 self.startup_sequence(splash)
+                return
+            loading_lbl.config(text=f"LOADING MODULES {next(spinner)}")
+            splash.after(80, update_loading)
         
         update_loading()
 
+    def _bg_startup(self):
+        """起動時の重い処理 (Pillow の import・ロゴのデコード・全単語の取得)。Tk には触らない"""
+        try:
+            img_path = resource_path("logo.png")
+            if self.splash_style == "Modern" and os.path.exists(img_path):
+                try:
+                    from PIL import Image
+                    raw = Image.open(img_path)
+                    raw.thumbnail((100, 100))
+                    self._splash_logo = raw
+                except Exception:
+                    pass # Pillow が無い・画像が壊れている場合は文字のまま
+            self._startup_words = self.db.get_all_words()
+        finally:
+            self._startup_done.set() # 失敗してもスプラッシュは閉じる (読み直しは startup_sequence で)
+
     def startup_sequence(self, splash):
-        self.data_cache = self.db.get_all_words()
+        self.data_cache = self._startup_words if self._startup_words is not None else self.db.get_all_words()
+        # 最初の一覧 (検索語なし) はスプラッシュ中に読んだ結果をそのまま使う
+        self._search_cache[("", self.search_mode.get())] = (self.data_cache, [item['term'] for item in self.data_cache])
         self.setup_ui()
+        # 配置計算を表示前に1回で済ませておく (deiconify 後に少しずつ再描画されないように)
+        self.root.update_idletasks()
         splash.destroy()
         self.root.deiconify()
         self.log(f"System ready. {len(self.data_cache)} words loaded.", "success")
@@ -285,8 +415,10 @@ class ReDicSearcherApp:
         self.frame_read = tk.Frame(self.content_frame, bg=self.colors["bg"])
         self.setup_read_mode()
         
-        self.frame_write = tk.Frame(self.content_frame, bg=self.colors["bg"])
-        self.setup_write_mode()
+        # 編集フォームは初めて WRITE モードに切り替えたときに作る (toggle_mode)
+        self.frame_write = None
+        self.entry_labels = []
+        self.entries = {}
 
         self.current_mode = "read"
         self.frame_read.pack(fill=tk.BOTH, expand=True)
@@ -360,9 +492,9 @@ class ReDicSearcherApp:
         self.listbox.bind('<<ListboxSelect>>', self.show_detail)
         self.widgets["listbox"] = self.listbox
 
-        sb = tk.Scrollbar(left_group, orient=tk.VERTICAL, command=self.listbox.yview)
-        sb.pack(side=tk.RIGHT, fill=tk.Y)
-        self.listbox.config(yscrollcommand=sb.set)
+        self.list_sb = tk.Scrollbar(left_group, orient=tk.VERTICAL, command=self.listbox.yview)
+        self.list_sb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.listbox.config(yscrollcommand=self.on_list_scroll)
 
         detail_frame = tk.Frame(paned, bg=self.colors["bg"], padx=15)
         paned.add(detail_frame, minsize=400)
@@ -377,6 +509,7 @@ class ReDicSearcherApp:
         self.widgets["detail_text"] = self.detail_text
 
     def setup_write_mode(self):
+        self.frame_write = tk.Frame(self.content_frame, bg=self.colors["bg"])
         self.widgets["frame_write"] = self.frame_write
         self.entry_labels = []
         self.entries = {}
@@ -489,13 +622,16 @@ class ReDicSearcherApp:
             self.db.set_setting("theme", new_theme)
             self.db.set_setting("splash_style", new_splash)
             
+            theme_changed = new_theme != self.current_theme_name
             self.current_theme_name = new_theme
             self.splash_style = new_splash
             self.colors = THEMES[new_theme]
+            self.theme = THEMES_RESOLVED[new_theme]
             
-            # メイン画面に適用
-            self.apply_theme_to_root()
-            self.apply_theme_to_widgets()
+            # メイン画面に適用 (テーマが変わっていなければ全ウィジェットの塗り直しは不要)
+            if theme_changed:
+                self.apply_theme_to_root()
+                self.apply_theme_to_widgets()
             
             self.log(f"Config Saved: {new_theme} / {new_splash}", "success")
             dlg.destroy()
@@ -529,53 +665,57 @@ class ReDicSearcherApp:
         new_theme = "Light" if self.current_theme_name == "Dark" else "Dark"
         self.current_theme_name = new_theme
         self.colors = THEMES[new_theme]
+        self.theme = THEMES_RESOLVED[new_theme]
         self.db.set_setting("theme", new_theme)
         self.apply_theme_to_root()
         self.apply_theme_to_widgets()
         self.log(f"Theme switched to {new_theme}", "info")
 
     def apply_theme_to_widgets(self):
-        c = self.colors
+        t = self.theme
+        bg, fg, btn_bg, btn_fg, input_bg = t.bg, t.fg, t.btn_bg, t.btn_fg, t.input_bg
         frames = ["header_frame", "content_frame", "frame_read", "frame_write", "search_frame", 
                   "opt_frame", "left_group", "order_frame", "detail_frame", "btn_box", "log_frame"]
         for name in frames:
-            if name in self.widgets: self.widgets[name].configure(bg=c["bg"])
+            if name in self.widgets: self.widgets[name].configure(bg=bg)
 
         labels = ["lbl_search", "lbl_detail_term", "lbl_write_title", "lbl_log_title"]
         for name in labels:
-            if name in self.widgets: self.widgets[name].configure(bg=c["bg"], fg=c["fg"])
+            if name in self.widgets: self.widgets[name].configure(bg=bg, fg=fg)
 
         for lbl in self.entry_labels:
-            lbl.configure(bg=c["bg"], fg=c["fg_dim"])
+            lbl.configure(bg=bg, fg=t.fg_dim)
 
         # ボタン色
-        btn_bg = c.get("btn_bg", "#333333")
-        btn_fg = c.get("btn_fg", "#FFFFFF")
-        
         self.btn_import.configure(bg=btn_bg, fg=btn_fg)
         self.btn_config.configure(bg=btn_bg, fg=btn_fg)
         
-        self.btn_mode.configure(bg=c["accent"], fg="#FFFFFF")
-        self.btn_up.configure(bg=btn_bg, fg=c["fg"])
-        self.btn_down.configure(bg=btn_bg, fg=c["fg"])
-        self.btn_save.configure(bg=c["accent"], fg="#FFFFFF")
-        self.btn_clear.configure(bg="#444444" if self.current_theme_name=="Dark" else "#AAAAAA", fg="#FFFFFF")
-        self.btn_delete.configure(bg="#CC0000", fg="#FFFFFF")
+        self.btn_mode.configure(bg=t.accent, fg="#FFFFFF")
+        self.btn_up.configure(bg=btn_bg, fg=fg)
+        self.btn_down.configure(bg=btn_bg, fg=fg)
+        if self.frame_write is not None:
+            self.btn_save.configure(bg=t.accent, fg="#FFFFFF")
+            self.btn_clear.configure(bg=t.form_clear_bg, fg="#FFFFFF")
+            self.btn_delete.configure(bg="#CC0000", fg="#FFFFFF")
+            self.pos_menu.configure(bg=input_bg, fg=fg, activebackground=t.accent, activeforeground="#FFFFFF")
+            self.pos_menu["menu"].configure(bg=input_bg, fg=fg)
 
         entries = ["entry_search"] + [f"entry_{k}" for k in ["term", "pronunciation", "meaning", "example"]]
         for name in entries:
             if name in self.widgets:
-                self.widgets[name].configure(bg=c["input_bg"], fg=c["input_fg"], insertbackground=c["fg"])
+                self.widgets[name].configure(bg=input_bg, fg=t.input_fg, insertbackground=fg)
 
-        self.listbox.configure(bg=c["list_bg"], fg=c["list_fg"], selectbackground=c["select_bg"], selectforeground=c["select_fg"])
-        self.detail_text.configure(bg=c["bg"], fg=c["fg"])
-        self.log_text.configure(bg="#050505" if self.current_theme_name=="Dark" else "#FFFFFF", fg=c["fg"])
+        self.listbox.configure(bg=t.list_bg, fg=t.list_fg, selectbackground=t.select_bg, selectforeground=t.select_fg)
+        self.detail_text.configure(bg=bg, fg=fg)
+        self.log_text.configure(bg=t.log_bg, fg=fg)
+        # ログの色分けタグはテーマが変わったときだけ設定し直す (log() では触らない)
+        self.log_text.tag_config("info", foreground=t.log_fg_info)
+        self.log_text.tag_config("error", foreground=t.log_fg_err)
+        self.log_text.tag_config("success", foreground=t.accent)
+        self.log_text.tag_config("warn", foreground=t.log_fg_warn)
 
         for rb in self.radios:
-            rb.configure(bg=c["bg"], fg=c["fg"], selectcolor=c["bg"], activebackground=c["bg"], activeforeground=c["fg"])
-        
-        self.pos_menu.configure(bg=c["input_bg"], fg=c["fg"], activebackground=c["accent"], activeforeground="#FFFFFF")
-        self.pos_menu["menu"].configure(bg=c["input_bg"], fg=c["fg"])
+            rb.configure(bg=bg, fg=fg, selectcolor=bg, activebackground=bg, activeforeground=fg)
 
     # ==========================================
     #  その他ロジック
@@ -583,13 +723,7 @@ class ReDicSearcherApp:
     def log(self, message, level="info"):
         self.log_text.config(state="normal")
         timestamp = time.strftime("[%H:%M:%S]")
-        c = self.colors
-        self.log_text.tag_config("info", foreground=c["log_fg_info"])
-        self.log_text.tag_config("error", foreground=c["log_fg_err"])
-        self.log_text.tag_config("success", foreground=c["accent"])
-        self.log_text.tag_config("warn", foreground="#FFD700" if self.current_theme_name=="Dark" else "#FF8C00")
-        self.log_text.insert(tk.END, f"{timestamp} ", "info")
-        self.log_text.insert(tk.END, f"{message}\n", level)
+        self.log_text.insert(tk.END, f"{timestamp} ", "info", f"{message}\n", level)
         self.log_text.see(tk.END)
         self.log_text.config(state="disabled")
 
@@ -612,48 +746,70 @@ class ReDicSearcherApp:
                 for k, v in content.items():
                     v['term'] = k
                     items_to_add.append(v)
-            success_count = 0
+            rows = []
             for item in items_to_add:
                 term = item.get("term", item.get("word", ""))
                 if term:
-                    data = {
-                        'term': term,
-                        'pronunciation': item.get("pronunciation", ""),
-                        'pos': item.get("part_of_speech", item.get("pos", "")),
-                        'meaning': item.get("definition", item.get("meaning", "")),
-                        'example': item.get("example", "")
-                    }
-                    self.db.upsert_word(data)
-                    success_count += 1
-            self.log(f"Imported/Updated {success_count} words from JSON.", "success")
+                    rows.append((term,
+                                 item.get("pronunciation", ""),
+                                 item.get("part_of_speech", item.get("pos", "")),
+                                 item.get("definition", item.get("meaning", "")),
+                                 item.get("example", "")))
+            self.db.upsert_many(rows)
+            self._search_cache.clear()
+            self.log(f"Imported/Updated {len(rows)} words from JSON.", "success")
             self.refresh_list()
         except Exception as e:
             self.log(f"Import Error: {e}", "error")
 
     def refresh_list(self, query=""):
+        key = self._last_search = (query, self.search_mode.get())
+        if key in self._search_cache:
+            self._search_cache.move_to_end(key)
+            self.data_cache, terms = self._search_cache[key]
+        else:
+            # 絞り込みは DatabaseManager がメモリ上の索引 (word_index) で行う
+            if query: self.data_cache = self.db.search(query, self.search_mode.get())
+            else: self.data_cache = self.db.get_all_words()
+            terms = [item['term'] for item in self.data_cache]
+            self._search_cache[key] = (self.data_cache, terms)
+            if len(self._search_cache) > SEARCH_CACHE_SIZE: self._search_cache.popitem(last=False)
+        if terms == self._list_terms: return # 表示内容が同じなら作り直さない (選択位置も保たれる)
+        self._list_terms = terms
         self.listbox.delete(0, tk.END)
-        self.data_cache = self.db.get_all_words()
-        query = query.lower()
-        mode = self.search_mode.get()
-        for item in self.data_cache:
-            word = item['term']
-            w_lower = word.lower()
-            match = False
-            if not query: match = True
-            elif mode == "contains" and query in w_lower: match = True
-            elif mode == "startswith" and w_lower.startswith(query): match = True
-            elif mode == "endswith" and w_lower.endswith(query): match = True
-            if match: self.listbox.insert(tk.END, word)
+        self.fill_list(LIST_PAGE)
+
+    def fill_list(self, upto):
+        """_list_terms のうち、まだ Listbox に入っていない分を upto 件目まで追加する"""
+        terms = self._list_terms[self.listbox.size():upto]
+        if terms: self.listbox.insert(tk.END, *terms)
+
+    def on_list_scroll(self, first, last):
+        self.list_sb.set(first, last)
+        if float(last) > 0.9: self.fill_list(self.listbox.size() + LIST_PAGE) # 下の方まで来たら続きを読み込む
 
     def on_search(self, event=None):
-        self.refresh_list(self.entry_search.get())
+        # Shift などの修飾キーだけなら何もしない。連続入力は最後の入力から 120ms 後に1回だけ検索する
+        if event is not None and event.keysym in MODIFIER_KEYS: return
+        if self._search_after_id: self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(120, self._do_search)
+
+    def _do_search(self):
+        self._search_after_id = None
+        query = self.entry_search.get()
+        if (query, self.search_mode.get()) == self._last_search: return # 矢印キーなどで内容が変わっていない
+        self.refresh_list(query)
+
+    def item_at(self, idx):
+        """一覧の idx 行目の単語の行 (一覧は data_cache と同じ順に並んでいるので走査せずに引ける)"""
+        return self.data_cache[idx] if idx < len(self.data_cache) else None
 
     def show_detail(self, event):
         sel = self.listbox.curselection()
         if not sel: return
-        term = self.listbox.get(sel[0])
-        item = next((x for x in self.data_cache if x['term'] == term), None)
+        item = self.item_at(sel[0])
         if not item: return
+        term = item['term']
         self.lbl_detail_term.config(text=term)
         content = f"【発音】 {item['pronunciation']}\n【品詞】 {item['pos']}\n\n【意味】\n{item['meaning']}\n\n【例文】\n{item['example']}"
         self.detail_text.config(state="normal")
@@ -673,8 +829,17 @@ class ReDicSearcherApp:
         if not data['term']:
             self.log("Term is required.", "warn")
             return
-        result = self.db.upsert_word(data)
-        self.refresh_list(self.entry_search.get())
+        row, result = self.db.upsert_word(data)
+        self._search_cache.clear()
+        # 表を読み直さず、変わった1行だけ一覧に反映する
+        term = row['term']
+        if term in self._list_terms:
+            self.data_cache[self._list_terms.index(term)] = row
+        elif result == "created" and self._last_search and self.db.term_matches(term, *self._last_search):
+            # 新規の単語は sort_order が最大なので一覧の末尾に来る (まだ読み込んでいないページがあればそちらで表示される)
+            if self.listbox.size() == len(self._list_terms): self.listbox.insert(tk.END, term)
+            self.data_cache.append(row)
+            self._list_terms.append(term)
         if result == "created": self.log(f"Registered: {data['term']}", "success")
         else: self.log(f"Updated: {data['term']}", "success")
 
@@ -683,8 +848,12 @@ class ReDicSearcherApp:
         if not term: return
         if messagebox.askyesno("Delete", f"Really delete '{term}'?"):
             self.db.delete_word(term)
+            self._search_cache.clear()
             self.clear_form()
-            self.refresh_list(self.entry_search.get())
+            if term in self._list_terms:
+                idx = self._list_terms.index(term)
+                del self.data_cache[idx], self._list_terms[idx]
+                if idx < self.listbox.size(): self.listbox.delete(idx)
             self.log(f"Deleted: {term}", "warn")
 
     def fill_form(self, item):
@@ -701,6 +870,9 @@ class ReDicSearcherApp:
 
     def toggle_mode(self):
         if self.current_mode == "read":
+            if self.frame_write is None:
+                self.setup_write_mode()
+                self.apply_theme_to_widgets()
             self.frame_read.pack_forget()
             self.frame_write.pack(fill=tk.BOTH, expand=True)
             self.current_mode = "write"
@@ -708,8 +880,7 @@ class ReDicSearcherApp:
             try:
                 sel = self.listbox.curselection()
                 if sel:
-                    term = self.listbox.get(sel[0])
-                    item = next((x for x in self.data_cache if x['term'] == term), None)
+                    item = self.item_at(sel[0])
                     if item: self.fill_form(item)
             except: pass
         else:
@@ -722,7 +893,7 @@ class ReDicSearcherApp:
     def move_down(self): self._move_item(1)
 
     def _move_item(self, direction):
-        if self.entry_search.get():
+        if self.entry_search.get() or self._last_search[0]:
             self.log("Clear search before reordering.", "warn")
             return
         sel = self.listbox.curselection()
@@ -732,8 +903,17 @@ class ReDicSearcherApp:
         if 0 <= target_idx < len(self.data_cache):
             item1 = self.data_cache[idx]
             item2 = self.data_cache[target_idx]
-            self.db.update_order(item1['term'], item2['sort_order'], item2['term'], item1['sort_order'])
-            self.refresh_list()
+            updated = self.db.update_order(item1['term'], item2['sort_order'], item2['term'], item1['sort_order'])
+            # 表を読み直さず、入れ替えた2行だけを一覧に反映する
+            self.fill_list(max(idx, target_idx) + 1)
+            self.data_cache[idx], self.data_cache[target_idx] = updated[item2['term']], updated[item1['term']]
+            self._list_terms[idx], self._list_terms[target_idx] = item2['term'], item1['term']
+            lo = min(idx, target_idx)
+            self.listbox.delete(lo, lo + 1)
+            self.listbox.insert(lo, self._list_terms[lo], self._list_terms[lo + 1])
+            # 他の検索結果は並び順が古くなるので捨て、今の一覧だけ覚え直す
+            self._search_cache.clear()
+            self._search_cache[self._last_search] = (self.data_cache, self._list_terms)
             self.listbox.selection_set(target_idx)
             self.listbox.see(target_idx)
             self.log(f"Moved '{item1['term']}'", "info")
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import sqlite3
+import atexit
 import json
 import os
 import sys
@@ -41,6 +42,11 @@ PART_OF_SPEECH_LIST = [
     "Det(限定詞)", "Aux(助動詞)", "Part(助詞)", "Num(数詞)", "Other"
 ]
 
+# 詳細文中の [単語] をリンクとして拾う
+_LINK_RE = re.compile(r'\[([^\]]+)\]')
+
+MODIFIER_KEYS = {"Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R", "Meta_L", "Meta_R"}
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
@@ -54,13 +60,30 @@ def resource_path(relative_path):
 class DatabaseManager:
     def __init__(self, db_file):
         self.db_file = db_file
+        self.conn = None
+        self.connect()
+        atexit.register(self.close)
         self.init_db()
 
+    def connect(self):
+        # 接続は起動時に1本だけ開いて使い回す (検索のたびに開き直すとページキャッシュも捨ててしまう)
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        # 接続ごとに効く設定 (WAL なら synchronous=NORMAL でもコミットで壊れない)
+        for pragma in ("synchronous=NORMAL", "temp_store=MEMORY", "cache_size=-64000", "busy_timeout=5000"):
+            self.conn.execute(f"PRAGMA {pragma}")
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
     def get_connection(self):
-        return sqlite3.connect(self.db_file)
+        return self.conn
 
     def init_db(self):
         with self.get_connection() as conn:
+            # WAL はファイルに記録されるので起動時に1回だけ切り替える (書き込み中も読み出しを止めない)
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS dictionary (
@@ -89,24 +112,28 @@ class DatabaseManager:
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
 
     def upsert_word(self, data):
+        # 登録済みの単語は UPDATE の1文で済ませ、更新する行が無かった (rowcount 0) ときだけ INSERT する
+        # (ON CONFLICT 付きの INSERT は衝突しても AUTOINCREMENT の id を消費するので使わない)
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM dictionary WHERE term = ?", (data['term'],))
-            exists = cursor.fetchone()
-            if exists:
-                cursor.execute("""
-                    UPDATE dictionary SET pronunciation=?, pos=?, meaning=?, example=? WHERE term=?
-                """, (data['pronunciation'], data['pos'], data['meaning'], data['example'], data['term']))
-                return "updated"
-            else:
-                cursor.execute("SELECT MAX(sort_order) FROM dictionary")
-                max_order = cursor.fetchone()[0]
-                new_order = 1 if max_order is None else max_order + 1
-                cursor.execute("""
-                    INSERT INTO dictionary (term, pronunciation, pos, meaning, example, sort_order)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (data['term'], data['pronunciation'], data['pos'], data['meaning'], data['example'], new_order))
-                return "created"
+            cursor = conn.execute("""
+                UPDATE dictionary SET pronunciation=?, pos=?, meaning=?, example=? WHERE term=?
+            """, (data['pronunciation'], data['pos'], data['meaning'], data['example'], data['term']))
+            if cursor.rowcount: return "updated"
+            conn.execute("""
+                INSERT INTO dictionary (term, pronunciation, pos, meaning, example, sort_order)
+                VALUES (?, ?, ?, ?, ?, COALESCE((SELECT MAX(sort_order) + 1 FROM dictionary), 1))
+            """, (data['term'], data['pronunciation'], data['pos'], data['meaning'], data['example']))
+            return "created"
+
+    def upsert_many(self, rows):
+        # インポート用 (コミットは最後の1回だけ)
+        with self.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO dictionary (term, pronunciation, pos, meaning, example, sort_order)
+                VALUES (?, ?, ?, ?, ?, COALESCE((SELECT MAX(sort_order) + 1 FROM dictionary), 1))
+                ON CONFLICT(term) DO UPDATE SET
+                    pronunciation=excluded.pronunciation, pos=excluded.pos, meaning=excluded.meaning, example=excluded.example
+            """, rows)
 
     def delete_word(self, term):
         with self.get_connection() as conn:
@@ -147,7 +174,11 @@ class ReDicSearcherApp:
         self.colors = THEMES[self.current_theme_name]
         self.search_mode = tk.StringVar(value="contains")
         self.data_cache = []
+        self._terms, self._terms_lower = [], [] # 検索用 (_rebuild_lower_index で作る)
+        self._term_index, self._term_index_ci = {}, {} # 単語 → data_cache の位置
+        self._list_terms = [] # 一覧に今表示している単語
         self.widgets = {}
+        self._search_after_id = None # on_search の after ID
         
         self.apply_theme_to_root()
         self.setup_shortcuts() # ショートカット設定
@@ -234,7 +265,7 @@ class ReDicSearcherApp:
         update_loading()
 
     def startup_sequence(self, splash):
-        self.data_cache = self.db.get_all_words()
+        self.reload_data()
         self.setup_ui()
         splash.destroy()
         self.root.deiconify()
@@ -385,7 +416,7 @@ class ReDicSearcherApp:
         sel = self.listbox.curselection()
         if not sel: return
         term = self.listbox.get(sel[0])
-        item = next((x for x in self.data_cache if x['term'] == term), None)
+        item = self.item_for(term)
         if not item: return
 
         self.lbl_detail_term.config(text=term)
@@ -395,9 +426,8 @@ class ReDicSearcherApp:
         self.detail_text.delete(1.0, tk.END)
         
         # --- リンク解析と表示 ---
-        pattern = re.compile(r'\[(.*?)\]') # [単語] を探す正規表現
         last_pos = 0
-        for match in pattern.finditer(content):
+        for match in _LINK_RE.finditer(content):
             # リンクの前のテキスト
             self.detail_text.insert(tk.END, content[last_pos:match.start()])
             
@@ -429,15 +459,13 @@ class ReDicSearcherApp:
 
     def jump_to_word(self, word):
         """リンクをクリックしたときのジャンプ処理"""
-        # リストにあるか確認
-        items = self.listbox.get(0, tk.END)
         try:
-            # 大文字小文字を区別せず検索
-            idx = -1
-            for i, item in enumerate(items):
-                if item.lower() == word.lower():
-                    idx = i
-                    break
+            # 大文字小文字を区別せず辞書で引き、一覧のどこにあるかを調べる
+            i = self._term_index_ci.get(word.lower())
+            if i is None: idx = -1
+            elif self._list_terms is self._terms: idx = i # 絞り込みなし: 一覧の位置 = data_cache の位置
+            elif self._terms[i] in self._list_terms: idx = self._list_terms.index(self._terms[i])
+            else: idx = -1
             
             if idx != -1:
                 self.listbox.selection_clear(0, tk.END)
@@ -507,7 +535,7 @@ class ReDicSearcherApp:
                 sel = self.listbox.curselection()
                 if sel:
                     term = self.listbox.get(sel[0])
-                    item = next((x for x in self.data_cache if x['term'] == term), None)
+                    item = self.item_for(term)
                     if item: self.fill_form(item)
             except: pass
         else:
@@ -560,45 +588,61 @@ class ReDicSearcherApp:
         try:
             with open(filepath, 'r', encoding='utf-8') as f: content = json.load(f)
             items = content if isinstance(content, list) else [dict(term=k, **v) for k, v in content.items()]
-            count = 0
-            for item in items:
-                term = item.get("term", item.get("word", ""))
-                if term:
-                    self.db.upsert_word({
-                        'term': term, 'pronunciation': item.get("pronunciation", ""),
-                        'pos': item.get("part_of_speech", item.get("pos", "")),
-                        'meaning': item.get("definition", item.get("meaning", "")),
-                        'example': item.get("example", "")
-                    })
-                    count += 1
-            self.log(f"Imported {count} items.", "success"); self.refresh_list()
+            rows = [(term, item.get("pronunciation", ""), item.get("part_of_speech", item.get("pos", "")),
+                     item.get("definition", item.get("meaning", "")), item.get("example", ""))
+                    for item in items for term in [item.get("term", item.get("word", ""))] if term]
+            self.db.upsert_many(rows); self.reload_data()
+            self.log(f"Imported {len(rows)} items.", "success"); self.refresh_list()
         except Exception as e: self.log(f"Import Error: {e}", "error")
 
+    def reload_data(self):
+        # DB を変更したとき (保存・削除・インポート・並び替え) だけ読み直す。検索は data_cache だけを見る
+        self.data_cache = self.db.get_all_words()
+        self._rebuild_lower_index()
+
+    def _rebuild_lower_index(self):
+        # 検索用に単語と小文字化した単語を data_cache と同じ並びで持っておく (キー入力のたびに lower() しない)
+        self._terms = [item['term'] for item in self.data_cache]
+        self._terms_lower = [t.lower() for t in self._terms]
+        self._term_index = {t: i for i, t in enumerate(self._terms)}
+        self._term_index_ci = {}
+        for i, t_l in enumerate(self._terms_lower): self._term_index_ci.setdefault(t_l, i) # 大文字小文字違いは先頭を優先
+
+    def item_for(self, term):
+        i = self._term_index.get(term)
+        return None if i is None else self.data_cache[i]
+
     def refresh_list(self, query=""):
         self.listbox.delete(0, tk.END)
-        self.data_cache = self.db.get_all_words()
         query = query.lower(); mode = self.search_mode.get()
-        for item in self.data_cache:
-            w = item['term']; w_l = w.lower(); m = False
-            if not query: m = True
-            elif mode == "contains" and query in w_l: m = True
-            elif mode == "startswith" and w_l.startswith(query): m = True
-            elif mode == "endswith" and w_l.endswith(query): m = True
-            if m: self.listbox.insert(tk.END, w)
-
-    def on_search(self, event=None): self.refresh_list(self.entry_search.get())
+        if query:
+            # 判定関数はループの外で一度だけ選ぶ
+            pred = {"contains": str.__contains__, "startswith": str.startswith, "endswith": str.endswith}[mode]
+            matches = [t for t, t_l in zip(self._terms, self._terms_lower) if pred(t_l, query)]
+        else: matches = self._terms
+        self._list_terms = matches
+        self.listbox.insert(tk.END, *matches) # 1回の呼び出しでまとめて追加する
+
+    def on_search(self, event=None):
+        # 入力が 80ms 止まってから検索 (Shift 等だけの入力は無視)
+        if event is not None and event.keysym in MODIFIER_KEYS: return
+        if self._search_after_id: self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(80, self._do_search)
+    def _do_search(self):
+        self._search_after_id = None
+        self.refresh_list(self.entry_search.get())
     def save_entry(self):
         if self.current_mode != "write": return # ショートカット暴発防止
         data = {k: self.entries[k].get().strip() for k in ["term", "pronunciation", "meaning", "example"]}
         data["pos"] = self.pos_var.get()
         if not data['term']: return self.log("Term required.", "warn")
-        res = self.db.upsert_word(data)
+        res = self.db.upsert_word(data); self.reload_data()
         self.refresh_list(self.entry_search.get())
         self.log(f"{'Registered' if res=='created' else 'Updated'}: {data['term']}", "success")
     def delete_entry(self):
         term = self.entries["term"].get().strip()
         if term and messagebox.askyesno("Delete", f"Delete '{term}'?"):
-            self.db.delete_word(term); self.clear_form(); self.refresh_list(self.entry_search.get())
+            self.db.delete_word(term); self.reload_data(); self.clear_form(); self.refresh_list(self.entry_search.get())
             self.log(f"Deleted: {term}", "warn")
     def fill_form(self, item):
         self.clear_form()
@@ -617,7 +661,7 @@ class ReDicSearcherApp:
         if 0 <= ti < len(self.data_cache):
             self.db.update_order(self.data_cache[i]['term'], self.data_cache[ti]['sort_order'],
                                  self.data_cache[ti]['term'], self.data_cache[i]['sort_order'])
-            self.refresh_list(); self.listbox.selection_set(ti); self.listbox.see(ti)
+            self.reload_data(); self.refresh_list(); self.listbox.selection_set(ti); self.listbox.see(ti)
 
 if __name__ == "__main__":
     try: